@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class TeamTasksConfig(AppConfig):
+    name = "app"
+
+    def ready(self):
+        from app import checks  # noqa: F401
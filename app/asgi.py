@@ -9,8 +9,12 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+
+from app.handlers import ASGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
 
-application = get_asgi_application()
+# get_asgi_application() 과 같지만, 스트리밍 응답 본문을 스레드에서 만드는 핸들러를 씁니다.
+django.setup(set_prefix=False)
+application = ASGIHandler()
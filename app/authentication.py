@@ -0,0 +1,54 @@
+from django.utils.functional import cached_property
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+TEAM_ID_CLAIM = "team_id"
+
+
+class TeamTokenUser(TokenUser):
+    """
+    토큰의 user_id / team_id 클레임만으로 만든 가벼운 유저.
+
+    id, team_id 만 필요한 요청은 DB 조회 없이 처리되고, 유저 모델이 꼭 필요한
+    곳에서만 `user` (또는 `team`) 로 DB 에서 가져옵니다.
+    """
+
+    @cached_property
+    def team_id(self):
+        return self.token[TEAM_ID_CLAIM]
+
+    @cached_property
+    def user(self):
+        from app.models import User
+
+        return User.objects.select_related("team").get(id=self.id)
+
+    @property
+    def team(self):
+        return self.user.team
+
+
+class TeamJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    유저/팀을 DB 에서 조회하지 않고 토큰 클레임으로 인증합니다.
+
+    유저 모델 인스턴스가 필요한 뷰는 authentication_classes 를
+    rest_framework_simplejwt.authentication.JWTAuthentication 으로 지정합니다.
+    """
+
+    def get_user(self, validated_token):
+        if (
+            api_settings.USER_ID_CLAIM not in validated_token
+            or TEAM_ID_CLAIM not in validated_token
+        ):
+            raise InvalidToken("토큰에 유저/팀 정보가 없습니다.")
+
+        return TeamTokenUser(validated_token)
+
+
+class TeamJWTScheme(SimpleJWTScheme):
+    # Swagger 의 Authorize 에서 Bearer 토큰을 쓸 수 있도록 스키마에 인증 방식을 등록합니다.
+    target_class = "app.authentication.TeamJWTAuthentication"
@@ -0,0 +1,158 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class LRUCache:
+    """
+    프로세스 로컬 LRU 캐시. 최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 버립니다.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class FragmentCache:
+    """
+    직렬화 결과 조각 캐시.
+
+    항목은 id 로 저장하고 함께 저장한 스탬프(예: 수정시간, 하위 업무 버전)가
+    조회 시점의 스탬프와 같을 때만 사용하므로, 이전 버전 조각이 캐시를 차지하지 않습니다.
+    """
+
+    def __init__(self, maxsize):
+        self.hits = 0
+        self.misses = 0
+        self._entries = LRUCache(maxsize)
+
+    def get(self, key, stamp):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def set(self, key, stamp, fragment):
+        self._entries.set(key, (stamp, fragment))
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxsize": self._entries.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+task_fragment_cache = FragmentCache(maxsize=settings.TASK_FRAGMENT_CACHE_MAX_SIZE)
+
+
+def new_version():
+    """
+    버전 스탬프. 언제 갱신됐는지 알 수 있도록 "<uuid>:<갱신 시각>" 형태로 만듭니다.
+    """
+    return f"{uuid.uuid4().hex}:{time.time():.3f}"
+
+
+def is_recent_version(version, seconds):
+    """
+    버전이 최근 seconds 초 안에 갱신됐는지 여부.
+    """
+    _, _, bumped_at = version.partition(":")
+    try:
+        return time.time() - float(bumped_at) < seconds
+    except ValueError:
+        return False
+
+
+def get_version(key):
+    """
+    공유 캐시에 저장된 버전 스탬프. 없으면 새로 만들어 저장합니다.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, new_version(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def bump_version(key):
+    cache.set(key, new_version(), timeout=None)
+
+
+def team_task_version_key(team_id):
+    return f"team-task-version:{team_id}"
+
+
+def get_team_task_version(team_id):
+    return get_version(team_task_version_key(team_id))
+
+
+def bump_team_task_versions(team_ids):
+    """
+    팀별 업무 리스트 버전을 갱신합니다.
+
+    커밋 전에 갱신하면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있어
+    커밋 이후에 갱신합니다.
+    """
+    keys = [team_task_version_key(team_id) for team_id in set(team_ids) if team_id]
+    if not keys:
+        return
+
+    transaction.on_commit(
+        lambda: cache.set_many({key: new_version() for key in keys}, timeout=None)
+    )
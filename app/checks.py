@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# 프로세스마다 따로 저장되어 워커끼리 공유되지 않는 캐시
+LOCAL_CACHE_BACKENDS = [
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+]
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    팀 업무 리스트 / 팀 레지스트리의 버전 스탬프는 모든 워커가 같은 값을 봐야 하므로,
+    DEBUG 가 아니면 공유 캐시(redis / memcached)를 요구합니다.
+
+    워커마다 캐시가 다르면 쓰기를 처리하지 않은 워커가 이전 버전으로 304 를 응답합니다.
+    """
+    if settings.DEBUG or getattr(settings, "TESTING", False):
+        return []
+
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend not in LOCAL_CACHE_BACKENDS:
+        return []
+
+    return [
+        Error(
+            f"기본 캐시({backend})는 워커끼리 공유되지 않아 버전 스탬프가 어긋납니다.",
+            hint="CACHE_URL 로 redis / memcached 등 공유 캐시를 지정하세요.",
+            id="app.E001",
+        )
+    ]
@@ -0,0 +1,50 @@
+"""
+커넥션 풀을 사용하는 MySQL 백엔드.
+
+    DATABASES = {
+        "default": {
+            "ENGINE": "app.db.backends.mysql",
+            ...
+            "POOL": {"MAX_SIZE": 10, "TIMEOUT": 30, "MAX_IDLE_TIME": 300},
+        }
+    }
+
+Django 가 커넥션을 닫을 때(요청 종료 등) 실제로 닫지 않고 풀에 돌려두며,
+다음 커넥션 요청 때 ping 으로 살아있는지 확인한 뒤 다시 사용합니다.
+"""
+from django.db.backends.mysql.base import DatabaseWrapper as MySQLDatabaseWrapper
+
+from app.db.pool import get_pool, get_pool_key
+
+POOL_DEFAULTS = {"MAX_SIZE": 10, "TIMEOUT": 30, "MAX_IDLE_TIME": 300}
+
+
+def _ping(connection):
+    connection.ping()
+
+
+class DatabaseWrapper(MySQLDatabaseWrapper):
+    def get_pool(self, conn_params):
+        options = {**POOL_DEFAULTS, **self.settings_dict.get("POOL", {})}
+        return get_pool(
+            self.alias,
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            key=get_pool_key(conn_params, options),
+            max_size=options["MAX_SIZE"],
+            timeout=options["TIMEOUT"],
+            max_idle_time=options["MAX_IDLE_TIME"],
+            health_check=_ping,
+        )
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        return self.pool.acquire()
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        # 트랜잭션이 열린 채로 닫히는 커넥션은 상태를 알 수 없으므로 버립니다.
+        discard = self.in_atomic_block or not self.autocommit
+        with self.wrap_database_errors:
+            self.pool.release(self.connection, discard=discard)
@@ -0,0 +1,181 @@
+"""
+프로세스 안에서 DB 커넥션을 재사용하는 커넥션 풀.
+
+요청마다 커넥션을 새로 맺으면 TCP 연결 / 인증 왕복이 응답 시간에 그대로 더해지므로,
+요청이 끝난 커넥션을 풀에 돌려두었다가 다음 요청에서 다시 사용합니다.
+"""
+import hashlib
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    최대 max_size 개의 커넥션을 관리합니다.
+
+    - 꺼낼 때 health_check 로 끊어진 커넥션을 걸러냅니다.
+    - max_idle_time 초 넘게 쉬고 있던 커넥션은 버리고 새로 맺습니다.
+    - 모두 사용 중이면 timeout 초까지 반납을 기다립니다.
+    """
+
+    def __init__(
+        self,
+        factory,
+        max_size=10,
+        timeout=30,
+        max_idle_time=300,
+        health_check=None,
+        clock=time.monotonic,
+    ):
+        self.factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.health_check = health_check
+        self.clock = clock
+
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._checkouts = self._waits = self._discards = self._created = 0
+
+    def acquire(self):
+        deadline = None
+        with self._condition:
+            while True:
+                connection = self._pop_idle()
+                if connection is not None or self._size < self.max_size:
+                    break
+
+                if deadline is None:
+                    self._waits += 1
+                    deadline = self.clock() + self.timeout
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    raise PoolTimeout(f"{self.timeout}초 동안 사용 가능한 DB 커넥션이 없습니다.")
+                self._condition.wait(remaining)
+
+            self._checkouts += 1
+            if connection is None:
+                # 자리를 먼저 잡고 커넥션은 락 밖에서 맺습니다.
+                self._size += 1
+
+        if connection is None:
+            return self._create()
+        if not self._is_healthy(connection):
+            with self._condition:
+                self._discard(connection)
+                self._size += 1
+            return self._create()
+        return connection
+
+    def release(self, connection, discard=False):
+        with self._condition:
+            if discard or self._closed:
+                self._discard(connection)
+            else:
+                self._idle.append((connection, self.clock()))
+            self._condition.notify()
+
+    def close_all(self):
+        """
+        쉬고 있는 커넥션을 닫고, 사용 중인 커넥션도 반납될 때 닫습니다.
+        """
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._discard(connection)
+            self._condition.notify_all()
+
+    def stats(self):
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "discards": self._discards,
+                "created": self._created,
+            }
+
+    def _pop_idle(self):
+        # self._condition 을 잡은 상태에서 호출합니다.
+        while self._idle:
+            connection, released_at = self._idle.pop()
+            if self.clock() - released_at <= self.max_idle_time:
+                return connection
+            self._discard(connection)
+        return None
+
+    def _create(self):
+        try:
+            connection = self.factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._created += 1
+        return connection
+
+    def _is_healthy(self, connection):
+        if self.health_check is None:
+            return True
+        try:
+            return self.health_check(connection) is not False
+        except Exception:
+            return False
+
+    def _discard(self, connection):
+        # self._condition 을 잡은 상태에서 호출합니다.
+        self._size -= 1
+        self._discards += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool_key(*settings):
+    """
+    접속 정보 / 풀 설정(dict) 의 해시. 설정이 바뀌면 다른 키가 됩니다.
+    """
+    items = [sorted((key, repr(value)) for key, value in d.items()) for d in settings]
+    return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+def get_pool(alias, factory, key=None, **options):
+    """
+    DB alias 별 커넥션 풀을 돌려줍니다. 처음 호출될 때 만듭니다.
+
+    key(접속 정보 해시 등)가 바뀌면 이전 풀을 닫고 새로 만듭니다.
+    (테스트 DB 로 바뀌는 등 설정이 바뀐 뒤 이전 커넥션을 다시 쓰지 않도록 합니다.)
+    """
+    with _pools_lock:
+        pool_key, pool = _pools.get(alias, (None, None))
+        if pool is None or pool_key != key:
+            if pool is not None:
+                pool.close_all()
+            pool = ConnectionPool(factory, **options)
+            _pools[alias] = key, pool
+        return pool
+
+
+def get_pool_stats():
+    with _pools_lock:
+        pools = dict(_pools)
+    return {alias: pool.stats() for alias, (_, pool) in pools.items()}
@@ -0,0 +1,53 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY_DB = "default"
+
+# 요청 단위로 복제 DB 에서 읽어도 되는지 여부. (ReplicaRoutingMiddleware 가 설정)
+_read_from_replica = ContextVar("read_from_replica", default=False)
+
+
+def set_read_from_replica(value):
+    return _read_from_replica.set(value)
+
+
+def reset_read_from_replica(token):
+    _read_from_replica.reset(token)
+
+
+@contextmanager
+def read_from_replica(value):
+    token = set_read_from_replica(value)
+    try:
+        yield
+    finally:
+        reset_read_from_replica(token)
+
+
+class ReplicaRouter:
+    """
+    쓰기는 항상 primary 로, 읽기는 복제 DB 에서 읽어도 되는 요청일 때만 복제 DB 로 보냅니다.
+
+    관리 명령 / 쓰기 요청 / 쓰기 직후의 요청 등 그 외의 읽기는 모두 primary 에서 읽습니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = getattr(settings, "DATABASE_REPLICAS", [])
+        if replicas and _read_from_replica.get():
+            return random.choice(replicas)
+        return PRIMARY_DB
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY_DB, *getattr(settings, "DATABASE_REPLICAS", [])}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DB
@@ -0,0 +1,78 @@
+from django.db.models import Exists, OuterRef
+from django_filters import rest_framework as filters
+
+from app.models import Task, SubTask
+
+
+class TaskFilter(filters.FilterSet):
+    """
+    업무 리스트 필터.
+
+    팀 / 역할은 요청한 유저의 팀 기준이며, 생성일시는 업무함의 생성일시로 걸러
+    (team, task_created_at, task) 인덱스 범위 안에서 찾습니다.
+    """
+
+    ROLE_OWNER = "owner"
+    ROLE_ASSIGNEE = "assignee"
+
+    search = filters.CharFilter(
+        method="filter_search", help_text="제목 / 내용 검색어 (관련도 순으로 정렬)"
+    )
+    is_complete = filters.BooleanFilter(help_text="업무 완료 여부")
+    role = filters.ChoiceFilter(
+        choices=[(ROLE_OWNER, "업무 팀"), (ROLE_ASSIGNEE, "하위 업무 팀")],
+        method="filter_role",
+        help_text="owner: 우리 팀 업무, assignee: 우리 팀이 하위 업무를 부여받은 업무",
+    )
+    created_at = filters.IsoDateTimeFromToRangeFilter(
+        field_name="inbox_created_at",
+        help_text="업무 생성일시 범위 (created_at_after / created_at_before)",
+    )
+    completed_date = filters.IsoDateTimeFromToRangeFilter(
+        help_text="업무 완료일시 범위 (completed_date_after / completed_date_before)",
+    )
+    has_open_sub_tasks = filters.BooleanFilter(
+        method="filter_has_open_sub_tasks", help_text="미완료 하위 업무가 남았는지 여부"
+    )
+    sub_task_is_complete = filters.BooleanFilter(
+        method="filter_sub_task_is_complete",
+        help_text="우리 팀이 부여받은 하위 업무의 완료 여부",
+    )
+
+    class Meta:
+        model = Task
+        fields = [
+            "search",
+            "is_complete",
+            "role",
+            "created_at",
+            "completed_date",
+            "has_open_sub_tasks",
+            "sub_task_is_complete",
+        ]
+
+    @property
+    def team_id(self):
+        return self.request.user.team_id
+
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
+    def filter_role(self, queryset, name, value):
+        if value == self.ROLE_OWNER:
+            return queryset.filter(team_id=self.team_id)
+        return queryset.filter(self._team_sub_tasks())
+
+    def filter_has_open_sub_tasks(self, queryset, name, value):
+        if value:
+            return queryset.filter(open_sub_task_count__gt=0)
+        return queryset.filter(open_sub_task_count=0)
+
+    def filter_sub_task_is_complete(self, queryset, name, value):
+        return queryset.filter(self._team_sub_tasks(is_complete=value))
+
+    def _team_sub_tasks(self, **lookups):
+        # (team, task) 인덱스로 업무마다 우리 팀 하위 업무를 찾습니다.
+        return Exists(
+            SubTask.objects.filter(task=OuterRef("pk"), team_id=self.team_id, **lookups)
+        )
@@ -0,0 +1,51 @@
+"""
+스트리밍 응답 본문을 스레드에서 만드는 ASGI 핸들러.
+
+Django 4.1 의 ASGIHandler 는 StreamingHttpResponse 의 본문을 이벤트 루프에서 바로
+순회하므로, 내보내기처럼 본문을 만들며 DB 를 조회하는 응답은 SynchronousOnlyOperation 으로
+끊깁니다. 본문은 동기 뷰와 같은 스레드(thread_sensitive)에서 한 조각씩 만들어 보냅니다.
+"""
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIHandler as DjangoASGIHandler
+
+_END = object()
+
+
+class ASGIHandler(DjangoASGIHandler):
+    async def send_response(self, response, send):
+        if not response.streaming:
+            return await super().send_response(response, send)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": self.get_response_headers(response),
+            }
+        )
+        # Django 와 같이 streaming_content 대신 __iter__ 로 순회합니다.
+        next_part = sync_to_async(partial(next, iter(response), _END))
+        while (part := await next_part()) is not _END:
+            for chunk, _ in self.chunk_bytes(part):
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        await send({"type": "http.response.body"})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+    @staticmethod
+    def get_response_headers(response):
+        headers = []
+        for header, value in response.items():
+            if isinstance(header, str):
+                header = header.encode("ascii")
+            if isinstance(value, str):
+                value = value.encode("latin1")
+            headers.append((bytes(header), bytes(value)))
+        for cookie in response.cookies.values():
+            headers.append(
+                (b"Set-Cookie", cookie.output(header="").encode("ascii").strip())
+            )
+        return headers
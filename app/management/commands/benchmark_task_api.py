@@ -0,0 +1,222 @@
+import json
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from app.cache import task_fragment_cache
+from app.models import SubTask
+from app.seed import seed_tasks
+from app.serializers.token import TeamTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "테스트 DB 에 데이터를 만들어 업무 API 의 지연시간 / 처리량 / 쿼리 수를 잽니다. "
+        "(실제 DB 의 데이터는 건드리지 않습니다.)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=10, help="팀 수")
+        parser.add_argument("--tasks-per-team", type=int, default=1000, help="팀당 업무 수")
+        parser.add_argument(
+            "--sub-tasks-per-task", type=int, default=3, help="업무당 하위 업무 수"
+        )
+        parser.add_argument("--requests", type=int, default=200, help="엔드포인트별 요청 수")
+        parser.add_argument("--seed", type=int, default=0, help="요청 대상 선택용 난수 시드")
+        parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 2:
+            raise CommandError("--requests 는 2 이상이어야 합니다. (분위수 계산)")
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            result = self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        self._print(result)
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                self._print_comparison(json.load(f), result)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+    def _run(self, options):
+        started_at = time.perf_counter()
+        seeded = seed_tasks(
+            options["teams"],
+            options["tasks_per_team"],
+            options["sub_tasks_per_task"],
+            password="benchmark",
+        )
+        seed_seconds = time.perf_counter() - started_at
+
+        self.random = random.Random(options["seed"])
+        self.clients = {}
+        for user in seeded.users:
+            client = APIClient()
+            token = TeamTokenObtainPairSerializer.get_token(user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+            self.clients[user.team_id] = client
+
+        requests = options["requests"]
+        endpoints = {
+            "GET /tasks/": self._list_requests(requests),
+            "GET /tasks/ (cold cache)": self._list_requests(requests, cold=True),
+            "GET /tasks/?cursor (10 pages)": self._deep_list_requests(requests),
+            "POST /tasks/": self._create_requests(requests, seeded.team_ids),
+            "POST sub-task completion": self._complete_requests(
+                requests, seeded.task_ids
+            ),
+        }
+
+        return {
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "config": {
+                name: options[name]
+                for name in [
+                    "teams",
+                    "tasks_per_team",
+                    "sub_tasks_per_task",
+                    "requests",
+                ]
+            },
+            "seed": {
+                "rows": seeded.row_count,
+                "seconds": round(seed_seconds, 3),
+                "rows_per_second": round(seeded.row_count / seed_seconds),
+            },
+            "endpoints": {
+                name: self._measure(calls) for name, calls in endpoints.items()
+            },
+        }
+
+    def _list_requests(self, count, cold=False):
+        for _ in range(count):
+            client = self.random.choice(list(self.clients.values()))
+            if cold:
+                # 직렬화된 업무 캐시 없이 하위 업무 조회 / 직렬화까지 잽니다.
+                task_fragment_cache.clear()
+            yield lambda: client.get(reverse("task-list"))
+
+    def _deep_list_requests(self, count):
+        # 커서로 10 페이지 넘긴 위치의 페이지를 요청합니다.
+        for _ in range(count):
+            client = self.random.choice(list(self.clients.values()))
+            url = reverse("task-list")
+            for _ in range(10):
+                url = client.get(url).json()["next"] or url
+            yield lambda: client.get(url)
+
+    def _create_requests(self, count, team_ids):
+        for index in range(count):
+            team_id = self.random.choice(team_ids)
+            data = {
+                "title": f"벤치마크 업무 {index}",
+                "content": "벤치마크 업무 내용",
+                "team_ids": self.random.sample(team_ids, k=min(3, len(team_ids))),
+            }
+            yield lambda: self.clients[team_id].post(
+                reverse("task-list"), data, format="json"
+            )
+
+    def _complete_requests(self, count, task_ids):
+        sampled_task_ids = self.random.sample(task_ids, k=min(count, len(task_ids)))
+        sub_tasks = SubTask.objects.filter(
+            task_id__in=sampled_task_ids, is_complete=False
+        ).values_list("id", "task_id", "team_id")
+        targets = {
+            task_id: (sub_task_id, team_id)
+            for sub_task_id, task_id, team_id in sub_tasks
+        }
+
+        for task_id, (sub_task_id, team_id) in targets.items():
+            url = reverse(
+                "sub-task-completion", kwargs={"task_id": task_id, "pk": sub_task_id}
+            )
+            yield lambda: self.clients[team_id].post(url)
+
+    @staticmethod
+    def _measure(calls):
+        latencies, query_counts = [], []
+        total = 0.0
+        for call in calls:
+            with CaptureQueriesContext(connection) as context:
+                started_at = time.perf_counter()
+                resp = call()
+                elapsed = time.perf_counter() - started_at
+            if resp.status_code >= 400:
+                raise CommandError(f"요청 실패 ({resp.status_code}): {resp.content!r}")
+            latencies.append(elapsed * 1000)
+            query_counts.append(len(context.captured_queries))
+            total += elapsed
+
+        # 분위수는 2건 이상이어야 구할 수 있습니다. (예: 완료할 하위 업무가 없는 경우)
+        if len(latencies) < 2:
+            return {"requests": len(latencies), "skipped": True}
+
+        p50, p95, p99 = (
+            statistics.quantiles(latencies, n=100, method="inclusive")[index]
+            for index in (49, 94, 98)
+        )
+        return {
+            "requests": len(latencies),
+            "p50_ms": round(p50, 3),
+            "p95_ms": round(p95, 3),
+            "p99_ms": round(p99, 3),
+            "requests_per_second": round(len(latencies) / total, 1),
+            "queries_per_request": round(statistics.mean(query_counts), 2),
+        }
+
+    def _print(self, result):
+        seed = result["seed"]
+        self.stdout.write(
+            f"[{result['database']}] 데이터 {seed['rows']}건 생성: "
+            f"{seed['seconds']}초 ({seed['rows_per_second']} rows/s)"
+        )
+        for name, stats in result["endpoints"].items():
+            if stats.get("skipped"):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{name:<30} 요청 {stats['requests']}건으로 측정하지 않았습니다."
+                    )
+                )
+                continue
+            self.stdout.write(
+                f"{name:<30} p50 {stats['p50_ms']:>8.2f} ms  "
+                f"p95 {stats['p95_ms']:>8.2f} ms  p99 {stats['p99_ms']:>8.2f} ms  "
+                f"{stats['requests_per_second']:>8.1f} req/s  "
+                f"쿼리 {stats['queries_per_request']}"
+            )
+
+    def _print_comparison(self, previous, result):
+        self.stdout.write(f"이전 결과({previous['created_at']}) 대비 p50 / p95 변화")
+        for name, stats in result["endpoints"].items():
+            before = previous["endpoints"].get(name)
+            if before is None or before.get("skipped") or stats.get("skipped"):
+                continue
+            changes = [
+                f"{key[:3]} {(stats[key] - before[key]) / before[key] * 100:+.1f}%"
+                for key in ["p50_ms", "p95_ms"]
+            ]
+            self.stdout.write(f"{name:<30} " + "  ".join(changes))
@@ -0,0 +1,100 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework.renderers import JSONRenderer
+
+from app.models import Task, SubTask, Team, User
+from app.renderers import ORJSONRenderer
+from app.serializers.task import TaskSerializer
+from app.serializers.task_rows import (
+    TASK_FIELDS,
+    build_task_row,
+    get_sub_task_rows_by_task,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "업무 리스트 직렬화 경로를 비교합니다. "
+        "(ModelSerializer + JSONRenderer / .values() 행 + ORJSONRenderer)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1000, help="업무 수")
+        parser.add_argument("--sub-tasks", type=int, default=3, help="업무당 하위 업무 수")
+        parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+
+    def handle(self, *args, **options):
+        # 벤치마크용 데이터는 끝나면 롤백합니다.
+        with transaction.atomic():
+            task_ids = self._create_tasks(options["tasks"], options["sub_tasks"])
+            self._run(task_ids, options["repeat"])
+            transaction.set_rollback(True)
+
+    def _create_tasks(self, task_count, sub_task_count):
+        teams = [
+            Team.objects.create(team_name=f"벤치마크 팀 {index}", is_verified=True)
+            for index in range(max(sub_task_count, 1))
+        ]
+        user = User.objects.create_user(
+            user_name="벤치마크 유저", password="benchmark", team=teams[0]
+        )
+        tasks = [
+            Task.objects.create(
+                create_user=user,
+                team=teams[0],
+                title=f"업무 {index}",
+                content="벤치마크 업무 내용 " * 10,
+            )
+            for index in range(task_count)
+        ]
+        SubTask.objects.bulk_create(
+            SubTask(task=task, team=team)
+            for task in tasks
+            for team in teams[:sub_task_count]
+        )
+
+        return [task.id for task in tasks]
+
+    def _serializer_path(self, task_ids):
+        tasks = (
+            Task.objects.filter(id__in=task_ids)
+            .order_by("-created_at", "-id")
+            .prefetch_related(
+                Prefetch("sub_tasks", queryset=SubTask.objects.order_by("id"))
+            )
+        )
+        return JSONRenderer().render(TaskSerializer(tasks, many=True).data)
+
+    def _fast_path(self, task_ids):
+        tasks = list(
+            Task.objects.filter(id__in=task_ids)
+            .order_by("-created_at", "-id")
+            .values(*TASK_FIELDS)
+        )
+        sub_task_rows = get_sub_task_rows_by_task([task["id"] for task in tasks])
+        return ORJSONRenderer().render(
+            [build_task_row(task, sub_task_rows.get(task["id"], [])) for task in tasks]
+        )
+
+    def _run(self, task_ids, repeat):
+        if self._serializer_path(task_ids) != self._fast_path(task_ids):
+            self.stderr.write(self.style.ERROR("두 경로의 응답이 다릅니다."))
+            return
+
+        results = {}
+        for name, path in [
+            ("serializer", self._serializer_path),
+            ("fast", self._fast_path),
+        ]:
+            started_at = time.perf_counter()
+            for _ in range(repeat):
+                path(task_ids)
+            results[name] = (time.perf_counter() - started_at) / repeat * 1000
+            self.stdout.write(f"{name:>10}: {results[name]:.2f} ms")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{results['serializer'] / results['fast']:.1f}배 빠름")
+        )
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.views.schema import generate_schema
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마를 파일로 만듭니다. (/schema/ 는 이 파일을 그대로 응답합니다.)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=settings.OPENAPI_SCHEMA_FILE,
+            help=f"스키마 파일 경로 (기본값: {settings.OPENAPI_SCHEMA_FILE})",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="파일을 쓰지 않고, 파일이 현재 코드의 스키마와 다르면 실패합니다.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["file"]
+        schema = generate_schema()
+
+        if options["check"]:
+            try:
+                with open(path, "rb") as f:
+                    current = f.read()
+            except FileNotFoundError:
+                raise CommandError(f"스키마 파일이 없습니다: {path}")
+
+            if current != schema:
+                raise CommandError(
+                    "스키마 파일이 코드와 다릅니다. "
+                    "python manage.py build_openapi_schema 로 다시 만들어 주세요."
+                )
+            self.stdout.write(self.style.SUCCESS("스키마 파일이 최신입니다."))
+            return
+
+        with open(path, "wb") as f:
+            f.write(schema)
+        self.stdout.write(self.style.SUCCESS(f"스키마 파일 생성 완료: {path}"))
@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.models import Task, SubTask, TeamTaskInbox
+
+
+class Command(BaseCommand):
+    help = "업무/하위 업무를 기준으로 팀별 업무함(TeamTaskInbox)을 청크 단위로 다시 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="한 번에 처리할 업무 수 (기본값: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_task_id = 0
+        created_count = deleted_count = 0
+
+        while True:
+            # 하위 업무 생성 / 삭제 / 완료는 같은 트랜잭션에서 업무 행을 갱신하므로, 업무 행을
+            # 잠근 뒤 하위 업무와 업무함을 읽으면 그 사이에 추가된 업무함 행을 지우지 않습니다.
+            with transaction.atomic():
+                tasks = list(
+                    Task.objects.select_for_update()
+                    .filter(id__gt=last_task_id)
+                    .order_by("id")
+                    .values_list("id", "team_id", "created_at")[:chunk_size]
+                )
+                if not tasks:
+                    break
+
+                first_task_id, last_task_id = tasks[0][0], tasks[-1][0]
+                task_created_at = {
+                    task_id: created_at for task_id, _, created_at in tasks
+                }
+
+                expected = {
+                    (team_id, task_id) for task_id, team_id, _ in tasks if team_id
+                }
+                expected |= set(
+                    SubTask.objects.filter(
+                        task_id__gte=first_task_id,
+                        task_id__lte=last_task_id,
+                        team__isnull=False,
+                    ).values_list("team_id", "task_id")
+                )
+
+                existing = {
+                    (team_id, task_id): inbox_id
+                    for inbox_id, team_id, task_id in TeamTaskInbox.objects.filter(
+                        task_id__gte=first_task_id, task_id__lte=last_task_id
+                    ).values_list("id", "team_id", "task_id")
+                }
+
+                stale_ids = [
+                    inbox_id
+                    for key, inbox_id in existing.items()
+                    if key not in expected
+                ]
+                if stale_ids:
+                    TeamTaskInbox.objects.filter(id__in=stale_ids).delete()
+
+                TeamTaskInbox.objects.bulk_create(
+                    [
+                        TeamTaskInbox(
+                            team_id=team_id,
+                            task_id=task_id,
+                            task_created_at=task_created_at[task_id],
+                        )
+                        for team_id, task_id in expected - existing.keys()
+                    ],
+                    ignore_conflicts=True,
+                )
+
+            created_count += len(expected - existing.keys())
+            deleted_count += len(stale_ids)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"업무 {last_task_id} 번까지 처리했습니다.")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"업무함 동기화 완료: {created_count}건 추가, {deleted_count}건 삭제")
+        )
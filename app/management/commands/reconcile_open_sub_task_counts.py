@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F
+from django.utils import timezone
+
+from app.cache import bump_team_task_versions
+from app.models import Task, SubTask, TeamTaskInbox
+
+
+class Command(BaseCommand):
+    help = "업무의 미완료 하위 업무 수(open_sub_task_count)를 실제 하위 업무와 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="한 번에 확인할 업무 수 (기본값: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_task_id = 0
+        fixed_count = 0
+        completed_count = 0
+
+        while True:
+            tasks = list(
+                Task.objects.filter(id__gt=last_task_id)
+                .order_by("id")
+                .values_list("id", "open_sub_task_count")[:chunk_size]
+            )
+            if not tasks:
+                break
+
+            first_task_id, last_task_id = tasks[0][0], tasks[-1][0]
+            open_counts = dict(
+                SubTask.objects.filter(
+                    task_id__gte=first_task_id,
+                    task_id__lte=last_task_id,
+                    is_complete=False,
+                )
+                .order_by()
+                .values("task_id")
+                .annotate(count=Count("id"))
+                .values_list("task_id", "count")
+            )
+
+            zeroed_task_ids = []
+            for task_id, stored_count in tasks:
+                actual_count = open_counts.get(task_id, 0)
+                if stored_count == actual_count:
+                    continue
+
+                # 확인 이후 바뀐 값은 덮어쓰지 않도록 읽었던 값을 조건으로 갱신합니다.
+                updated = Task.objects.filter(
+                    id=task_id, open_sub_task_count=stored_count
+                ).update(
+                    open_sub_task_count=actual_count,
+                    sub_task_version=F("sub_task_version") + 1,
+                )
+                fixed_count += updated
+                if updated and actual_count == 0:
+                    zeroed_task_ids.append(task_id)
+
+            # 보정으로 미완료 하위 업무가 없어진 업무는 완료 처리합니다.
+            if zeroed_task_ids:
+                completed_count += Task.objects.roll_up_completion(
+                    zeroed_task_ids, timezone.now()
+                )
+                bump_team_task_versions(
+                    TeamTaskInbox.objects.team_ids_for(zeroed_task_ids)
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"미완료 하위 업무 수 보정 완료: {fixed_count}건 (완료 처리 {completed_count}건)"
+            )
+        )
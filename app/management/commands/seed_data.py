@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.constants.task import TEAM_NAMES
+from app.seed import bulk_load_session, create_teams_and_users, seed_data
+
+
+class Command(BaseCommand):
+    help = "팀 / 유저 / 업무 / 하위 업무 데이터를 대량으로 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base",
+            action="store_true",
+            help="기본 팀(TEAM_NAMES)과 팀별 유저 한 명만 만듭니다.",
+        )
+        parser.add_argument("--teams", type=int, default=100, help="팀 수")
+        parser.add_argument("--users", type=int, default=1000, help="유저 수")
+        parser.add_argument("--tasks", type=int, default=100000, help="업무 수")
+        parser.add_argument(
+            "--max-sub-tasks", type=int, default=5, help="업무당 최대 하위 업무 수"
+        )
+        parser.add_argument("--days", type=int, default=365, help="업무 생성일시 범위(일)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+        parser.add_argument("--password", default="1234", help="모든 유저의 비밀번호")
+        parser.add_argument(
+            "--batch-size", type=int, default=10000, help="한 번에 넣을 업무 수"
+        )
+
+    def handle(self, *args, **options):
+        if options["base"]:
+            create_teams_and_users(TEAM_NAMES, options["password"])
+            self.stdout.write(self.style.SUCCESS(f"기본 팀 {len(TEAM_NAMES)}개 생성 완료"))
+            return
+
+        started_at = time.perf_counter()
+
+        def progress(task_count, row_count):
+            elapsed = time.perf_counter() - started_at
+            self.stdout.write(
+                f"업무 {task_count}/{options['tasks']} ({row_count / elapsed:.0f} rows/s)"
+            )
+
+        with bulk_load_session():
+            result = seed_data(
+                team_count=options["teams"],
+                user_count=options["users"],
+                task_count=options["tasks"],
+                max_sub_tasks=options["max_sub_tasks"],
+                days=options["days"],
+                seed=options["seed"],
+                password=options["password"],
+                batch_size=options["batch_size"],
+                progress=progress,
+            )
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.row_count}건 생성 완료: {elapsed:.1f}초 "
+                f"({result.row_count / elapsed:.0f} rows/s)"
+            )
+        )
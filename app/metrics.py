@@ -0,0 +1,221 @@
+"""
+프로세스 단위 요청 메트릭과 Prometheus 텍스트 형식 출력.
+
+요청마다는 버킷 / 합계 숫자만 더하고, 텍스트 변환은 /metrics 를 수집할 때만 합니다.
+"""
+import bisect
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.db.backends.signals import connection_created
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_labels(labelnames, labels, extra=()):
+    pairs = [*zip(labelnames, labels), *extra]
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] += amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in values.items():
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(labels)
+            if values is None:
+                values = self._values[labels] = [0] * (len(self.buckets) + 2)
+            values[index] += 1
+            values[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {labels: list(counts) for labels, counts in self._values.items()}
+
+        for labels, counts in values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", _format_labels(
+                    self.labelnames, labels, [("le", bound)]
+                ), cumulative
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), counts[
+                -1
+            ]
+            yield f"{self.name}_count", _format_labels(
+                self.labelnames, labels
+            ), cumulative
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        """
+        수집할 때마다 (이름, 타입, 설명, [(라벨 dict, 값), ...]) 들을 돌려주는 함수를 등록합니다.
+        """
+        self.collectors.append(collector)
+        return collector
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+
+        for collector in self.collectors:
+            for name, type_, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_}")
+                for labels, value in samples:
+                    labels = _format_labels(labels.keys(), labels.values())
+                    lines.append(f"{name}{labels} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+request_duration = registry.register(
+    Histogram(
+        "app_request_duration_seconds",
+        "요청 처리 시간",
+        ("method", "route", "status"),
+    )
+)
+request_db_duration = registry.register(
+    Histogram(
+        "app_request_db_duration_seconds",
+        "요청 하나에서 DB 쿼리에 쓴 시간",
+        ("route",),
+    )
+)
+request_db_queries = registry.register(
+    Counter("app_request_db_queries_total", "요청에서 실행한 DB 쿼리 수", ("route",))
+)
+request_serialize_duration = registry.register(
+    Histogram(
+        "app_request_serialize_duration_seconds",
+        "응답 데이터(업무 리스트 행)를 만드는 직렬화 시간",
+        ("route",),
+    )
+)
+request_render_duration = registry.register(
+    Histogram(
+        "app_request_render_duration_seconds",
+        "응답 렌더링(직렬화 결과를 바이트로 변환) 시간",
+        ("route",),
+    )
+)
+
+
+@registry.register_collector
+def collect_db_pool_stats():
+    from app.db.pool import get_pool_stats
+
+    pool_stats = get_pool_stats()
+    for key, name, type_, documentation in [
+        ("size", "app_db_pool_size", "gauge", "커넥션 풀의 커넥션 수"),
+        ("in_use", "app_db_pool_in_use", "gauge", "사용 중인 커넥션 수"),
+        ("checkouts", "app_db_pool_checkouts_total", "counter", "커넥션을 꺼낸 횟수"),
+        ("waits", "app_db_pool_waits_total", "counter", "커넥션을 기다린 횟수"),
+        ("discards", "app_db_pool_discards_total", "counter", "버린 커넥션 수"),
+    ]:
+        yield name, type_, documentation, [
+            ({"alias": alias}, stats[key]) for alias, stats in pool_stats.items()
+        ]
+
+
+# 지금 처리 중인 요청의 쿼리 타이머. 비동기 ORM 이 쿼리를 실행하는 스레드로도 전달됩니다.
+_query_timer = ContextVar("query_timer", default=None)
+
+
+class QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+def set_query_timer(timer):
+    return _query_timer.set(timer)
+
+
+def reset_query_timer(token):
+    _query_timer.reset(token)
+
+
+def _time_query(execute, sql, params, many, context):
+    timer = _query_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.duration += perf_counter() - started
+        timer.count += 1
+
+
+def install_query_timer(connection, **kwargs):
+    """
+    커넥션에 쿼리 시간을 재는 execute wrapper 를 한 번만 붙입니다.
+    """
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _time_query)
+
+
+@connection_created.connect
+def _install_query_timer(sender, connection, **kwargs):
+    install_query_timer(connection)
@@ -0,0 +1,203 @@
+from contextlib import contextmanager
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+
+from app import metrics
+from app.authentication import TeamJWTAuthentication
+from app.db.routers import read_from_replica
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class BaseMiddleware:
+    """
+    동기 / 비동기 요청을 모두 처리하는 미들웨어.
+
+    ASGI 에서 동기 전용 미들웨어가 있으면 비동기 뷰도 스레드에서 실행되므로,
+    handle() 로 요청을 감싸고 process_response() 로 응답을 처리하는 형태로 둘 다 지원합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        with self.handle(request):
+            response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        with self.handle(request):
+            response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    @contextmanager
+    def handle(self, request):
+        yield
+
+    def process_response(self, request, response):
+        return response
+
+
+class ReplicaRoutingMiddleware(BaseMiddleware):
+    """
+    읽기 요청(GET/HEAD/OPTIONS)은 복제 DB 에서 읽도록 합니다.
+
+    쓰기 요청 후 REPLICA_PIN_SECONDS 동안은 같은 클라이언트의 읽기 요청을 primary 에서 읽어
+    복제 지연과 상관없이 자기 변경을 볼 수 있게 합니다.
+    토큰으로 인증한 요청은 유저별로 공유 캐시에 고정 여부를 저장하고(쿠키를 보내지 않는 클라이언트도 있으므로),
+    그 외에는 쿠키로 고정합니다.
+    """
+
+    cookie_name = "use_primary_db"
+    pin_key_prefix = "replica-pin"
+    authentication = TeamJWTAuthentication()
+
+    def get_pin_key(self, request):
+        try:
+            result = self.authentication.authenticate(request)
+        except AuthenticationFailed:
+            # 잘못된 토큰은 뷰에서 401 로 응답합니다.
+            return None
+        if result is None:
+            return None
+
+        user, _ = result
+        return f"{self.pin_key_prefix}:{user.id}"
+
+    def can_read_from_replica(self, request):
+        if request.method not in SAFE_METHODS or self.cookie_name in request.COOKIES:
+            return False
+
+        pin_key = self.get_pin_key(request)
+        return pin_key is None or cache.get(pin_key) is None
+
+    @contextmanager
+    def handle(self, request):
+        request.read_from_replica = self.can_read_from_replica(request)
+        with read_from_replica(request.read_from_replica):
+            yield
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+            pin_key = self.get_pin_key(request)
+            if pin_key is not None:
+                cache.set(pin_key, 1, timeout=settings.REPLICA_PIN_SECONDS)
+        if response.streaming:
+            # 스트리밍 본문은 미들웨어를 빠져나온 뒤에 만들어지므로, 조각마다 다시 설정합니다.
+            response.streaming_content = self._iter_content(
+                response.streaming_content, request.read_from_replica
+            )
+        return response
+
+    @staticmethod
+    def _iter_content(content, value):
+        content = iter(content)
+        while True:
+            with read_from_replica(value):
+                part = next(content, None)
+            if part is None:
+                return
+            yield part
+
+
+class RequestTimer:
+    def __init__(self):
+        self.started = perf_counter()
+        self.queries = metrics.QueryTimer()
+        self.render_duration = 0.0
+        # 직렬화 시간을 재는 라우트(업무 리스트)에서만 값이 생깁니다.
+        self.serialize_duration = None
+
+    def record_render(self, started):
+        self.render_duration += perf_counter() - started
+
+    def record_serialize(self, started):
+        self.serialize_duration = (self.serialize_duration or 0.0) + (
+            perf_counter() - started
+        )
+
+
+class MetricsMiddleware(BaseMiddleware):
+    """
+    요청별 처리 / DB / 직렬화 / 렌더링 시간을 재서 Server-Timing 헤더로 내려주고,
+    라우트별 메트릭(/metrics)에 더합니다.
+
+    스트리밍 응답은 본문을 보내는 시간이 포함되지 않습니다.
+    """
+
+    @contextmanager
+    def handle(self, request):
+        request.timer = RequestTimer()
+        if not self.is_async:
+            for alias in connections:
+                metrics.install_query_timer(connections[alias])
+
+        token = metrics.set_query_timer(request.timer.queries)
+        try:
+            yield
+        finally:
+            metrics.reset_query_timer(token)
+
+    def process_template_response(self, request, response):
+        # DRF Response 는 미들웨어를 지나기 전에 렌더링되므로 여기서 시간을 잽니다.
+        started = perf_counter()
+        response.add_post_render_callback(
+            lambda rendered: request.timer.record_render(started)
+        )
+        return response
+
+    def process_response(self, request, response):
+        timer = request.timer
+        total = perf_counter() - timer.started
+        queries = timer.queries
+        serialize_duration = timer.serialize_duration or 0.0
+        app_duration = max(
+            total - queries.duration - serialize_duration - timer.render_duration, 0
+        )
+
+        timings = [
+            f'db;dur={queries.duration * 1000:.2f};desc="{queries.count} queries"'
+        ]
+        if timer.serialize_duration is not None:
+            timings.append(f"serialize;dur={serialize_duration * 1000:.2f}")
+        timings += [
+            f"render;dur={timer.render_duration * 1000:.2f}",
+            f"app;dur={app_duration * 1000:.2f}",
+            f"total;dur={total * 1000:.2f}",
+        ]
+        response["Server-Timing"] = ", ".join(timings)
+
+        resolver_match = request.resolver_match
+        route = resolver_match.route if resolver_match else "unmatched"
+        metrics.request_duration.observe(
+            (request.method, route, response.status_code), total
+        )
+        metrics.request_db_duration.observe((route,), queries.duration)
+        metrics.request_db_queries.inc((route,), queries.count)
+        metrics.request_render_duration.observe((route,), timer.render_duration)
+        if timer.serialize_duration is not None:
+            metrics.request_serialize_duration.observe(
+                (route,), timer.serialize_duration
+            )
+        return response
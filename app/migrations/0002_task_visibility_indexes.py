@@ -0,0 +1,22 @@
+# Generated by Django 4.1 on 2026-10-18 19:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subtask",
+            index=models.Index(fields=["team", "task"], name="sub_task_team_task_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["team", "created_at"], name="task_team_created_at_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.1 on 2026-10-18 19:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_team_task_inbox(apps, schema_editor):
+    """
+    기존 업무를 업무 팀과 하위 업무 팀의 업무함에 넣습니다.
+    (rebuild_team_task_inbox 와 같은 행을 한 번의 INSERT ... SELECT 로 만듭니다.)
+    """
+    Task = apps.get_model("app", "Task")
+    SubTask = apps.get_model("app", "SubTask")
+    TeamTaskInbox = apps.get_model("app", "TeamTaskInbox")
+
+    quote_name = schema_editor.connection.ops.quote_name
+    task_table = quote_name(Task._meta.db_table)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote_name(TeamTaskInbox._meta.db_table)} "
+            "(team_id, task_id, task_created_at) "
+            f"SELECT t.team_id, t.id, t.created_at FROM {task_table} t "
+            "WHERE t.team_id IS NOT NULL "
+            "UNION "
+            f"SELECT s.team_id, t.id, t.created_at FROM {quote_name(SubTask._meta.db_table)} s "
+            f"INNER JOIN {task_table} t ON t.id = s.task_id "
+            "WHERE s.team_id IS NOT NULL"
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0002_task_visibility_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamTaskInbox",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("task_created_at", models.DateTimeField(verbose_name="업무 생성일시")),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="team_inbox",
+                        to="app.task",
+                        verbose_name="업무함-업무",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="task_inbox",
+                        to="app.team",
+                        verbose_name="업무함-팀",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "팀별 업무함",
+                "verbose_name_plural": "팀별 업무함",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="teamtaskinbox",
+            index=models.Index(
+                fields=["team", "task_created_at", "task"],
+                name="inbox_team_created_at_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="teamtaskinbox",
+            constraint=models.UniqueConstraint(
+                fields=("team", "task"), name="unique_inbox_team_task"
+            ),
+        ),
+        migrations.RunPython(fill_team_task_inbox, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.1 on 2026-10-18 19:07
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_open_sub_task_count(apps, schema_editor):
+    Task = apps.get_model("app", "Task")
+    SubTask = apps.get_model("app", "SubTask")
+
+    open_sub_task_count = (
+        SubTask.objects.filter(task=OuterRef("pk"), is_complete=False)
+        .order_by()
+        .values("task")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Task.objects.update(open_sub_task_count=Coalesce(Subquery(open_sub_task_count), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0003_team_task_inbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="open_sub_task_count",
+            field=models.IntegerField(default=0, verbose_name="미완료 하위 업무 수"),
+        ),
+        migrations.RunPython(fill_open_sub_task_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0004_task_open_sub_task_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="sub_task_version",
+            field=models.PositiveIntegerField(default=0, verbose_name="하위 업무 버전"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1 on 2026-10-18 19:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0005_task_sub_task_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["team", "completed_date"], name="task_team_completed_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# MySQL: 한국어는 띄어쓰기 단위로 나누면 조사가 붙어 검색되지 않으므로 ngram 파서를 씁니다.
+MYSQL_FORWARD = [
+    "ALTER TABLE app_task ADD FULLTEXT INDEX task_title_content_ft (title, content) "
+    "WITH PARSER ngram",
+]
+MYSQL_BACKWARD = ["ALTER TABLE app_task DROP INDEX task_title_content_ft"]
+
+# SQLite(로컬): app_task 를 원본으로 하는 FTS5 테이블을 트리거로 맞춥니다.
+# SQLite 는 컬럼 변경 시 테이블을 다시 만들며 트리거가 지워지므로, 이후 Task 컬럼을
+# 바꾸는 마이그레이션은 SQLITE_FORWARD 를 다시 실행해야 합니다.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS app_task_fts USING fts5("
+    "title, content, content='app_task', content_rowid='id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS app_task_fts_insert AFTER INSERT ON app_task BEGIN "
+    "INSERT INTO app_task_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS app_task_fts_delete AFTER DELETE ON app_task BEGIN "
+    "INSERT INTO app_task_fts(app_task_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS app_task_fts_update "
+    "AFTER UPDATE OF title, content ON app_task BEGIN "
+    "INSERT INTO app_task_fts(app_task_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO app_task_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "INSERT INTO app_task_fts(app_task_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS app_task_fts_insert",
+    "DROP TRIGGER IF EXISTS app_task_fts_delete",
+    "DROP TRIGGER IF EXISTS app_task_fts_update",
+    "DROP TABLE IF EXISTS app_task_fts",
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0006_task_completed_date_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql({"mysql": MYSQL_FORWARD, "sqlite": SQLITE_FORWARD}),
+            run_vendor_sql({"mysql": MYSQL_BACKWARD, "sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .team import *
 from .user import *
 from .task import *
+from .inbox import *
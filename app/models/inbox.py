@@ -0,0 +1,60 @@
+from django.db import models
+
+from app.models.team import Team
+
+
+class TeamTaskInboxManager(models.Manager):
+    def add_entries(self, task, team_ids):
+        self.bulk_create(
+            [
+                self.model(team_id=team_id, task=task, task_created_at=task.created_at)
+                for team_id in set(team_ids)
+                if team_id is not None
+            ],
+            ignore_conflicts=True,
+        )
+
+    def team_ids_for(self, task_ids):
+        return set(self.filter(task_id__in=task_ids).values_list("team_id", flat=True))
+
+    def remove_entry(self, task, team_id):
+        # 업무 팀은 하위 업무가 삭제되어도 계속 업무를 볼 수 있어야 합니다.
+        if team_id is None or team_id == task.team_id:
+            return
+        self.filter(task=task, team_id=team_id).delete()
+
+
+class TeamTaskInbox(models.Model):
+    """
+    팀이 볼 수 있는 업무(업무 팀 또는 하위 업무 팀)를 팀 단위로 펼친 비정규화 테이블.
+    """
+
+    team = models.ForeignKey(
+        verbose_name="업무함-팀",
+        to=Team,
+        on_delete=models.CASCADE,
+        related_name="task_inbox",
+    )
+    task = models.ForeignKey(
+        verbose_name="업무함-업무",
+        to="app.Task",
+        on_delete=models.CASCADE,
+        related_name="team_inbox",
+    )
+    task_created_at = models.DateTimeField("업무 생성일시")
+
+    objects = TeamTaskInboxManager()
+
+    class Meta:
+        verbose_name = verbose_name_plural = "팀별 업무함"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "task"], name="unique_inbox_team_task"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["team", "task_created_at", "task"],
+                name="inbox_team_created_at_idx",
+            )
+        ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.db import connections, models
+from django.db.models import Case, DecimalField, F, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
 
 from app.models.base import DateModel
 from app.models.team import Team
@@ -23,6 +26,96 @@ class SubTask(DateModel):
         constraints = [
             models.UniqueConstraint(fields=["task", "team"], name="unique_task_team")
         ]
+        indexes = [models.Index(fields=["team", "task"], name="sub_task_team_task_idx")]
+
+
+class TaskQuerySet(models.QuerySet):
+    def visible_to(self, team_id):
+        """
+        업무 팀이거나 하위 업무를 부여받은 팀이 볼 수 있는 업무.
+
+        팀별 업무함(TeamTaskInbox) 의 (team, task_created_at, task) 인덱스 범위 조회로
+        찾습니다. 정렬/커서에는 업무함 컬럼(inbox_created_at, inbox_task_id)을 사용해야
+        인덱스 순서대로 읽을 수 있습니다.
+        """
+        return self.filter(team_inbox__team_id=team_id).annotate(
+            inbox_created_at=F("team_inbox__task_created_at"),
+            inbox_task_id=F("team_inbox__task_id"),
+        )
+
+    def search(self, text):
+        """
+        제목 / 내용 전문 검색. 관련도를 search_rank 로 붙입니다. (클수록 관련도가 높습니다.)
+
+        MySQL 은 FULLTEXT(ngram) 인덱스, SQLite 는 FTS5 테이블(app_task_fts)을 쓰며
+        그 외 DB 는 icontains 로 찾습니다.
+        """
+        vendor = connections[self.db].vendor
+        if vendor == "mysql":
+            # filter() 로 넘기면 "= 1" 비교가 붙어 FULLTEXT 인덱스를 쓰지 못하므로 where 에 둡니다.
+            match = "MATCH (app_task.title, app_task.content) AGAINST (%s)"
+            # 실수 관련도는 커서로 주고받으면 정확히 같은 값으로 비교되지 않을 수 있어
+            # 소수점 6자리 DECIMAL 로 반올림해 커서 위치와 정확히 비교되게 합니다.
+            return self.extra(where=[match], params=[text]).annotate(
+                search_rank=Cast(
+                    RawSQL(match, [text], output_field=FloatField()),
+                    output_field=DecimalField(max_digits=20, decimal_places=6),
+                )
+            )
+
+        if vendor == "sqlite":
+            # 단어마다 접두어 검색으로 바꿔 조사가 붙은 단어도 찾습니다. ("업무" -> 업무를)
+            query = " ".join(
+                '"{}"*'.format(term.replace('"', '""')) for term in text.split()
+            )
+            # FTS 테이블을 조인해 검색어로 먼저 찾은 뒤 업무 / 업무함을 pk 로 찾습니다.
+            return self.extra(
+                tables=["app_task_fts"],
+                where=["app_task_fts.rowid = app_task.id", "app_task_fts MATCH %s"],
+                params=[query],
+            ).annotate(
+                search_rank=RawSQL("-app_task_fts.rank", [], output_field=FloatField())
+            )
+
+        return self.filter(
+            Q(title__icontains=text) | Q(content__icontains=text)
+        ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    def add_open_sub_task_count(self, task_id, delta):
+        return self.filter(id=task_id).update(
+            open_sub_task_count=F("open_sub_task_count") + delta,
+            sub_task_version=F("sub_task_version") + 1,
+        )
+
+    def subtract_open_sub_task_counts(self, counts):
+        """
+        {업무 id: 차감할 수} 를 한 번의 UPDATE 로 반영합니다.
+        """
+        if not counts:
+            return 0
+
+        return self.filter(id__in=counts).update(
+            open_sub_task_count=F("open_sub_task_count")
+            - Case(
+                *[
+                    When(id=task_id, then=Value(count))
+                    for task_id, count in counts.items()
+                ],
+                default=Value(0),
+            ),
+            sub_task_version=F("sub_task_version") + 1,
+        )
+
+    def roll_up_completion(self, task_ids, completed_date):
+        """
+        미완료 하위 업무가 남지 않은 업무를 완료 처리합니다.
+
+        조건부 UPDATE 이므로 동시에 여러 팀이 마지막 하위 업무를 완료해도
+        정확히 한 번만 완료 처리됩니다.
+        """
+        return self.filter(
+            id__in=task_ids, open_sub_task_count=0, is_complete=False
+        ).update(is_complete=True, completed_date=completed_date)
 
 
 class Task(DateModel):
@@ -37,6 +130,20 @@ class Task(DateModel):
     content = models.TextField("내용")
     is_complete = models.BooleanField("완료 여부", default=False)
     completed_date = models.DateTimeField("완료 날짜", null=True, blank=True)
+    open_sub_task_count = models.IntegerField("미완료 하위 업무 수", default=0)
+    # 하위 업무가 바뀔 때마다 올라가며, 직렬화 캐시 키에 사용합니다.
+    sub_task_version = models.PositiveIntegerField("하위 업무 버전", default=0)
+
+    objects = TaskQuerySet.as_manager()
 
     class Meta:
         verbose_name = verbose_name_plural = "업무"
+        indexes = [
+            models.Index(
+                fields=["team", "created_at"], name="task_team_created_at_idx"
+            ),
+            # 우리 팀 업무의 완료일시 범위 필터 (role=owner&completed_date_*)
+            models.Index(
+                fields=["team", "completed_date"], name="task_team_completed_date_idx"
+            ),
+        ]
@@ -1,7 +1,42 @@
-from django.db import models
+from django.db import models, transaction
 
+from app.cache import bump_version
 from app.models.base import DateModel
 
+TEAM_REGISTRY_VERSION_KEY = "team-registry-version"
+
+
+def bump_team_registry_version():
+    """
+    팀 레지스트리(app.registry)의 버전을 갱신해 모든 워커가 로컬 팀 캐시를 비우게 합니다.
+
+    커밋 이후에 버전을 바꿔야 다른 워커가 이전 값을 다시 캐시하지 않습니다.
+    save() / delete() / 쿼리셋 update() 등을 거치지 않고 팀을 바꾸는 코드(raw SQL 등)는
+    직접 호출해야 합니다.
+    """
+    transaction.on_commit(lambda: bump_version(TEAM_REGISTRY_VERSION_KEY))
+
+
+class TeamQuerySet(models.QuerySet):
+    """
+    save() 를 거치지 않는 쿼리셋 변경도 팀 레지스트리 버전을 갱신합니다.
+    """
+
+    def update(self, **kwargs):
+        result = super().update(**kwargs)
+        bump_team_registry_version()
+        return result
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        result = super().bulk_update(objs, fields, batch_size=batch_size)
+        bump_team_registry_version()
+        return result
+
+    def delete(self):
+        result = super().delete()
+        bump_team_registry_version()
+        return result
+
 
 class Team(DateModel):
     team_name = models.CharField("팀 이름", max_length=255, unique=True)
@@ -9,3 +44,14 @@ class Team(DateModel):
 
     class Meta:
         verbose_name = verbose_name_plural = "팀"
+
+    objects = TeamQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        bump_team_registry_version()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_team_registry_version()
+        return result
@@ -0,0 +1,214 @@
+import base64
+import json
+from collections import OrderedDict
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def get_keyset_filter(ordering, position, reverse=False):
+    """
+    (a, b) < (x, y) 를 a < x OR (a = x AND b < y) 형태로 풀어 인덱스 범위 조회가
+    가능하도록 합니다. ordering 방향으로 position 다음(reverse 이면 이전) 행들을 찾습니다.
+    """
+    fields = [field.lstrip("-") for field in ordering]
+    descending = ordering[0].startswith("-")
+    lookup = "gt" if descending == reverse else "lt"
+
+    condition = Q()
+    for index, field in enumerate(fields):
+        equal = {f: value for f, value in zip(fields[:index], position)}
+        condition |= Q(**equal, **{f"{field}__{lookup}": position[index]})
+
+    return condition
+
+
+def get_position(obj, fields):
+    position = []
+    for field in fields:
+        value = obj[field] if isinstance(obj, dict) else getattr(obj, field)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            # 실수로 바꾸면 자릿수가 달라질 수 있어 문자열로 둡니다.
+            value = str(value)
+        position.append(value)
+
+    return position
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    (created_at, id) 키셋 기반 커서 페이지네이션.
+
+    OFFSET / COUNT 를 사용하지 않고 마지막으로 본 행의 위치 이후만 조회하므로,
+    몇 번째 페이지든 첫 페이지와 같은 비용으로 조회됩니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request, view)))
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """
+        페이지 크기보다 1개 더 조회하는 쿼리셋을 돌려줍니다.
+
+        비동기 뷰는 이 쿼리셋을 직접 조회한 뒤 결과를 set_page 로 넘깁니다.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        self.fields = [field.lstrip("-") for field in self.ordering]
+
+        cursor = self.decode_cursor(request)
+        self.has_cursor = cursor is not None
+        self.reverse = bool(cursor and cursor["r"])
+
+        if cursor is not None:
+            position = self.clean_position(queryset, cursor["p"])
+            queryset = queryset.filter(
+                get_keyset_filter(self.ordering, position, self.reverse)
+            )
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self._invert(field) for field in ordering]
+        return queryset.order_by(*ordering)[: self.page_size + 1]
+
+    def set_page(self, results):
+        self.has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if self.reverse:
+            results.reverse()
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+                if page_size > 0:
+                    return min(page_size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+
+        return self.page_size
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 커서",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 크기 (최대 {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_next_link(self):
+        if not self.page:
+            return None
+        # 역방향 페이지의 다음 페이지는 항상 존재합니다. (커서를 만든 행)
+        if not self.reverse and not self.has_more:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.page or not self.has_cursor:
+            return None
+        if self.reverse and not self.has_more:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        position = get_position(obj, self.fields)
+        payload = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            position, reverse = payload["p"], payload["r"]
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.fields):
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"p": position, "r": reverse}
+
+    def clean_position(self, queryset, position):
+        """
+        커서 위치 값을 정렬 필드의 타입으로 바꿉니다.
+
+        형식만 맞고 값이 잘못된 커서(다른 정렬의 커서 등)가 DB 조회에서 500 이 되지 않도록
+        여기서 NotFound 로 응답합니다.
+        """
+        cleaned = []
+        for name, value in zip(self.fields, position):
+            try:
+                cleaned.append(self._get_field(queryset, name).to_python(value))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+            if cleaned[-1] is None:
+                raise NotFound(self.invalid_cursor_message)
+
+        return cleaned
+
+    @staticmethod
+    def _get_field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith("-") else "-" + field
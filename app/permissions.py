@@ -5,5 +5,5 @@ class IsCreator(IsAuthenticated):
     def has_object_permission(self, request, view, obj):
         return (
             super().has_object_permission(request, view, obj)
-            and obj.task.create_user == request.user
+            and obj.task.create_user_id == request.user.id
         )
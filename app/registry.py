@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+
+from app.cache import LRUCache, get_version
+from app.models.team import TEAM_REGISTRY_VERSION_KEY, Team
+
+TeamInfo = namedtuple("TeamInfo", ["id", "team_name", "is_verified"])
+
+
+class TeamRegistry:
+    """
+    팀 id -> (이름, 인증 여부) 프로세스 로컬 캐시.
+
+    팀 정보가 바뀌면 공유 캐시(CACHES)의 버전 스탬프가 갱신되고, 각 워커는
+    최대 version_check_interval 초 안에 이를 확인해 로컬 캐시를 비웁니다.
+    (버전은 워커끼리 공유되어야 하므로 DEBUG 가 아니면 공유 캐시가 필요합니다. app.checks 참고)
+
+    Team.save() / delete() 와 Team 쿼리셋의 update() / bulk_update() / delete() 는
+    버전을 갱신하지만, raw SQL 로 팀을 바꾸면 bump_team_registry_version() 을 직접 불러야 합니다.
+    """
+
+    def __init__(self, maxsize, version_check_interval):
+        self.version_check_interval = version_check_interval
+        self._entries = LRUCache(maxsize)
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        self._check_version()
+        return self._version
+
+    def get(self, team_id):
+        return self.get_many([team_id]).get(team_id)
+
+    def get_many(self, team_ids):
+        """
+        존재하는 팀만 담은 {팀 id: TeamInfo} 를 돌려줍니다.
+        캐시에 없는 팀은 한 번의 조회로 가져옵니다.
+        """
+        self._check_version()
+
+        teams, missing_team_ids = {}, []
+        for team_id in set(team_ids):
+            team = self._entries.get(team_id)
+            if team is None:
+                missing_team_ids.append(team_id)
+            else:
+                teams[team_id] = team
+
+        if missing_team_ids:
+            for row in Team.objects.filter(id__in=missing_team_ids).values_list(
+                "id", "team_name", "is_verified"
+            ):
+                team = TeamInfo(*row)
+                self._entries.set(team.id, team)
+                teams[team.id] = team
+
+        return teams
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._checked_at = 0.0
+
+    def stats(self):
+        return self._entries.stats()
+
+    def _check_version(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.version_check_interval:
+            return
+
+        version = get_version(TEAM_REGISTRY_VERSION_KEY)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = now
+
+
+team_registry = TeamRegistry(
+    maxsize=settings.TEAM_REGISTRY_MAX_SIZE,
+    version_check_interval=settings.TEAM_REGISTRY_VERSION_CHECK_INTERVAL,
+)
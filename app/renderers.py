@@ -0,0 +1,108 @@
+import csv
+
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer 와 같은 바이트를 만드는 orjson 기반 렌더러.
+
+    들여쓰기나 ASCII 출력이 필요한 경우에는 JSONRenderer 로 렌더링합니다.
+    """
+
+    # datetime 등은 DRF 인코더와 같은 형식이 되도록 default 로 넘깁니다.
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+
+        # JSONRenderer 와 같이 \u2028, \u2029 는 이스케이프합니다.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+    def iter_render(self, rows, renderer_context=None):
+        """
+        행들을 JSON 배열로 조금씩 렌더링합니다.
+        """
+        yield b"["
+        for index, row in enumerate(rows):
+            yield self.render(row) if index == 0 else b"," + self.render(row)
+        yield b"]"
+
+
+def _iter_rows(data):
+    return [data] if isinstance(data, dict) else data
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    한 줄에 한 행씩 JSON 으로 렌더링합니다. (newline delimited JSON)
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"".join(self.iter_render(_iter_rows(data), renderer_context))
+
+    def iter_render(self, rows, renderer_context=None):
+        renderer = ORJSONRenderer()
+        for row in rows:
+            yield renderer.render(row) + b"\n"
+
+
+class _Echo:
+    # csv.writer 가 쓴 한 줄을 그대로 돌려받기 위한 파일 대용 객체입니다.
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    행들을 CSV 로 렌더링합니다.
+
+    renderer_context 의 header 가 있으면 그 순서로, 없으면 첫 행의 키 순서로 열을 씁니다.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+    flat = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"".join(self.iter_render(_iter_rows(data), renderer_context))
+
+    def iter_render(self, rows, renderer_context=None):
+        header = (renderer_context or {}).get("header")
+        writer = csv.writer(_Echo())
+        if header is not None:
+            yield writer.writerow(header).encode(self.charset)
+
+        for row in rows:
+            if header is None:
+                header = list(row)
+                yield writer.writerow(header).encode(self.charset)
+            line = writer.writerow([row.get(name) for name in header])
+            yield line.encode(self.charset)
@@ -0,0 +1,473 @@
+"""
+대량 데이터 생성.
+
+모델 인스턴스 / bulk_create 를 거치지 않고 컬럼 값 튜플을 executemany 로 나눠 넣습니다.
+(MySQL 의 bulk_create 는 pk 를 돌려주지 않으므로 하위 업무 / 업무함이 참조할 pk 도 미리 정합니다.)
+"""
+import random
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import accumulate, islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from faker import Faker
+
+from app.models import Team, User, Task, SubTask, TeamTaskInbox
+from app.models.team import bump_team_registry_version
+
+SeedResult = namedtuple("SeedResult", ["team_ids", "users", "task_ids", "row_count"])
+
+TEAM_FIELDS = ["id", "created_at", "modified_at", "team_name", "is_verified"]
+USER_FIELDS = ["id", "password", "user_name", "team_id"]
+TASK_FIELDS = [
+    "id",
+    "created_at",
+    "modified_at",
+    "create_user_id",
+    "team_id",
+    "title",
+    "content",
+    "is_complete",
+    "completed_date",
+    "open_sub_task_count",
+    "sub_task_version",
+]
+SUB_TASK_FIELDS = [
+    "id",
+    "created_at",
+    "modified_at",
+    "task_id",
+    "team_id",
+    "is_complete",
+    "completed_date",
+]
+INBOX_FIELDS = ["team_id", "task_id", "task_created_at"]
+
+
+def _columns(model, field_names):
+    quote_name = connection.ops.quote_name
+    return ", ".join(
+        quote_name(model._meta.get_field(name).column) for name in field_names
+    )
+
+
+def bulk_insert(model, field_names, rows):
+    """
+    field_names 순서의 값 튜플들을 한 번의 executemany 로 넣습니다.
+    """
+    if not rows:
+        return 0
+
+    placeholders = ", ".join(["%s"] * len(field_names))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} "
+            f"({_columns(model, field_names)}) VALUES ({placeholders})",
+            rows,
+        )
+    return len(rows)
+
+
+def insert_inbox_rows(task_ids, sub_task_ids):
+    """
+    id 범위(range)의 업무 / 하위 업무로 업무함 행을 만듭니다.
+
+    업무 팀과 (업무 팀이 아닌) 하위 업무 팀을 DB 안에서 모아 넣으므로 행마다 값을 넘기지 않습니다.
+    """
+    quote_name = connection.ops.quote_name
+    task_table = quote_name(Task._meta.db_table)
+    sub_task_table = quote_name(SubTask._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote_name(TeamTaskInbox._meta.db_table)} "
+            f"({_columns(TeamTaskInbox, INBOX_FIELDS)}) "
+            f"SELECT t.team_id, t.id, t.created_at FROM {task_table} t "
+            "WHERE t.id BETWEEN %s AND %s "
+            "UNION ALL "
+            f"SELECT s.team_id, t.id, t.created_at FROM {sub_task_table} s "
+            f"INNER JOIN {task_table} t ON t.id = s.task_id "
+            "WHERE s.id BETWEEN %s AND %s AND s.team_id <> t.team_id",
+            [
+                task_ids.start,
+                task_ids.stop - 1,
+                sub_task_ids.start,
+                sub_task_ids.stop - 1,
+            ],
+        )
+        return cursor.rowcount
+
+
+@contextmanager
+def bulk_load_session():
+    """
+    대량 적재 동안만 DB 의 검사 / 동기화를 줄입니다.
+
+    MySQL 은 외래키 / 유니크 검사를 끕니다. (pk 는 미리 정하고 참조하는 행도 같이
+    넣으므로 검사를 꺼도 데이터는 일관됩니다.)
+    SQLite 는 트랜잭션 안에서는 설정을 바꿀 수 없어 그대로 두고, 그 밖에서는 _sqlite_bulk_load 로
+    인덱스 / 전문 검색 색인을 적재 후에 한 번에 만듭니다.
+    """
+    if connection.vendor == "sqlite":
+        if connection.in_atomic_block:
+            yield
+        else:
+            with _sqlite_bulk_load():
+                yield
+        return
+
+    if connection.vendor == "mysql":
+        enter = ["SET SESSION foreign_key_checks = 0", "SET SESSION unique_checks = 0"]
+        leave = ["SET SESSION foreign_key_checks = 1", "SET SESSION unique_checks = 1"]
+    else:
+        enter = leave = []
+
+    _execute(enter)
+    try:
+        yield
+    finally:
+        _execute(leave)
+
+
+# 적재 동안 지웠다가 다시 만드는 SQLite 보조 인덱스의 테이블 / 업무 전문 검색 색인 트리거
+BULK_LOAD_TABLES = [Task, SubTask, TeamTaskInbox]
+TASK_FTS_TABLE = "app_task_fts"
+TASK_FTS_INSERT_TRIGGER = "app_task_fts_insert"
+
+
+@contextmanager
+def _sqlite_bulk_load():
+    """
+    SQLite 대량 적재.
+
+    - 커밋마다의 디스크 동기화를 끄고 페이지 캐시를 늘립니다.
+    - 보조 인덱스를 지웠다가 적재 후 다시 만들어, 행마다 인덱스를 고치지 않고 정렬 한 번으로 만듭니다.
+    - 업무 전문 검색 색인 트리거는 행마다 FTS 세그먼트를 새로 쓰므로 지워 두고,
+      적재한 업무를 한 번에 색인한 뒤 다시 만듭니다.
+
+    스키마(sqlite_master)의 SQL 을 그대로 다시 실행하므로 마이그레이션과 어긋나지 않습니다.
+    """
+    tables = [model._meta.db_table for model in BULK_LOAD_TABLES]
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        (synchronous,) = cursor.fetchone()
+        cursor.execute("PRAGMA cache_size")
+        (cache_size,) = cursor.fetchone()
+        # 자동으로 만든 인덱스(유니크 제약 / pk)는 sql 이 없으며 지울 수 없습니다.
+        cursor.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            f"WHERE tbl_name IN ({', '.join(['%s'] * len(tables))}) "
+            "AND ((type = 'index' AND sql IS NOT NULL) "
+            "OR (type = 'trigger' AND name = %s))",
+            [*tables, TASK_FTS_INSERT_TRIGGER],
+        )
+        deferred = cursor.fetchall()
+
+    first_task_id = _next_id(Task)
+    _execute(
+        [
+            "PRAGMA synchronous = OFF",
+            "PRAGMA cache_size = -262144",
+            *(f'DROP {kind.upper()} "{name}"' for kind, name, _ in deferred),
+        ]
+    )
+    try:
+        yield
+    finally:
+        statements = [sql for kind, _, sql in deferred if kind == "index"]
+        if any(kind == "trigger" for kind, _, _ in deferred):
+            statements.append(
+                f"INSERT INTO {TASK_FTS_TABLE}(rowid, title, content) "
+                f"SELECT id, title, content FROM {Task._meta.db_table} "
+                f"WHERE id >= {first_task_id}"
+            )
+        statements += [sql for kind, _, sql in deferred if kind == "trigger"]
+        with transaction.atomic():
+            _execute(statements)
+        _execute(
+            [
+                f"PRAGMA synchronous = {synchronous}",
+                f"PRAGMA cache_size = {cache_size}",
+            ]
+        )
+
+
+def _execute(statements):
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def _next_id(model):
+    return (model.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+
+
+def _zipf_cum_weights(count, exponent=1.1):
+    # 앞쪽 항목일수록 많이 뽑히는 누적 가중치 (소수의 팀 / 유저에 업무가 몰리는 분포)
+    return list(accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def create_teams_and_users(team_names, password, user_team_indexes=None):
+    """
+    팀과 유저를 만듭니다.
+
+    user_team_indexes 가 없으면 팀마다 "<팀 이름>-유저" 한 명을, 있으면 유저마다
+    소속 팀의 순번을 받아 "유저 <id>" 를 만듭니다.
+    """
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    first_team_id = _next_id(Team)
+    team_ids = list(range(first_team_id, first_team_id + len(team_names)))
+    # 비밀번호 해시는 한 번만 만들어 모든 유저가 같이 씁니다.
+    password_hash = make_password(password)
+
+    first_user_id = _next_id(User)
+    if user_team_indexes is None:
+        users = [
+            User(
+                id=first_user_id + index,
+                password=password_hash,
+                user_name=f"{team_name}-유저",
+                team_id=team_id,
+            )
+            for index, (team_id, team_name) in enumerate(zip(team_ids, team_names))
+        ]
+    else:
+        users = [
+            User(
+                id=first_user_id + index,
+                password=password_hash,
+                user_name=f"유저 {first_user_id + index}",
+                team_id=team_ids[team_index],
+            )
+            for index, team_index in enumerate(user_team_indexes)
+        ]
+
+    with transaction.atomic():
+        bulk_insert(
+            Team,
+            TEAM_FIELDS,
+            [
+                (team_id, now, now, team_name, True)
+                for team_id, team_name in zip(team_ids, team_names)
+            ],
+        )
+        bulk_insert(
+            User,
+            USER_FIELDS,
+            [(user.id, user.password, user.user_name, user.team_id) for user in users],
+        )
+        # save() 를 거치지 않으므로 커밋 후 팀 레지스트리를 직접 갱신합니다.
+        bump_team_registry_version()
+
+    return team_ids, users
+
+
+def seed_tasks(
+    team_count, tasks_per_team, sub_tasks_per_task, password, batch_size=5000
+):
+    """
+    팀마다 유저 한 명과 업무 tasks_per_team 개를 만들고, 업무마다 업무 팀부터 차례로
+    sub_tasks_per_task 개 팀에 하위 업무를 부여합니다. (벤치마크용 균등 분포)
+    """
+    sub_tasks_per_task = min(sub_tasks_per_task, team_count)
+    first_team_id = _next_id(Team)
+    team_ids, users = create_teams_and_users(
+        [f"팀 {first_team_id + index}" for index in range(team_count)], password
+    )
+
+    first_task_id = _next_id(Task)
+    task_count = team_count * tasks_per_team
+    generator = _TaskRowGenerator(first_task_id, _next_id(SubTask))
+    row_count = len(team_ids) + len(users)
+    for start in range(0, task_count, batch_size):
+        for index in range(start, min(start + batch_size, task_count)):
+            user = users[index % team_count]
+            owner_index = index % team_count
+            generator.add(
+                user,
+                title=f"업무 {first_task_id + index}",
+                content="업무 내용 " * 10,
+                created_at=generator.now,
+                sub_task_team_ids=[
+                    team_ids[(owner_index + offset) % team_count]
+                    for offset in range(sub_tasks_per_task)
+                ],
+            )
+        row_count += generator.flush()
+
+    return SeedResult(
+        team_ids, users, range(first_task_id, first_task_id + task_count), row_count
+    )
+
+
+def seed_data(
+    team_count,
+    user_count,
+    task_count,
+    max_sub_tasks=5,
+    days=365,
+    seed=0,
+    password="1234",
+    batch_size=10000,
+    progress=None,
+):
+    """
+    실제 서비스와 비슷하게 치우친 데이터를 만듭니다.
+
+    - 유저는 zipf 분포로 팀에 나뉘고, 업무도 zipf 분포로 일부 유저에 몰립니다.
+    - 하위 업무 수는 0 ~ max_sub_tasks 개로 적을수록 흔하고, 부여받는 팀도 인기 팀에 몰립니다.
+    - 생성일시는 최근 days 일 안에서 최근일수록 많고, 오래된 업무일수록 완료된 비율이 높습니다.
+
+    같은 seed 면 같은 데이터를 만듭니다.
+    """
+    rng = random.Random(seed)
+    fake = Faker("ko_KR")
+    fake.seed_instance(seed)
+
+    first_team_id = _next_id(Team)
+    team_names = [
+        f"{fake.company()} {first_team_id + index}" for index in range(team_count)
+    ]
+    # 모든 팀에 유저가 한 명 이상 있도록 한 명씩 먼저 배정합니다.
+    user_team_indexes = list(range(team_count)) + rng.choices(
+        range(team_count),
+        cum_weights=_zipf_cum_weights(team_count),
+        k=max(user_count - team_count, 0),
+    )
+    team_ids, users = create_teams_and_users(team_names, password, user_team_indexes)
+    row_count = len(team_ids) + len(users)
+
+    # Faker 는 행마다 호출하기에는 느리므로 문장을 미리 만들어 골라 씁니다.
+    titles = [fake.sentence()[:100] for _ in range(1000)]
+    contents = [fake.paragraph(nb_sentences=5) for _ in range(1000)]
+
+    user_cum_weights = _zipf_cum_weights(len(users))
+    team_cum_weights = _zipf_cum_weights(len(team_ids))
+    sub_task_counts = range(max_sub_tasks + 1)
+    sub_task_count_weights = [0.6**count for count in sub_task_counts]
+    max_age = timedelta(days=days).total_seconds()
+
+    first_task_id = _next_id(Task)
+    generator = _TaskRowGenerator(first_task_id, _next_id(SubTask), rng)
+    now = generator.now
+    for start in range(0, task_count, batch_size):
+        size = min(batch_size, task_count - start)
+        # 난수는 업무마다 뽑지 않고 배치 단위로 한 번에 뽑습니다.
+        owners = rng.choices(users, cum_weights=user_cum_weights, k=size)
+        counts = rng.choices(sub_task_counts, weights=sub_task_count_weights, k=size)
+        sub_task_team_ids = iter(
+            rng.choices(team_ids, cum_weights=team_cum_weights, k=sum(counts))
+        )
+        batch = zip(
+            owners, counts, rng.choices(titles, k=size), rng.choices(contents, k=size)
+        )
+        for user, count, title, content in batch:
+            age = max_age * rng.random() ** 2
+            generator.add(
+                user,
+                title=title,
+                content=content,
+                created_at=now - timedelta(seconds=age),
+                sub_task_team_ids=set(islice(sub_task_team_ids, count)),
+                complete_ratio=0.9 * age / max_age,
+            )
+        row_count += generator.flush()
+        if progress:
+            progress(start + size, row_count)
+
+    return SeedResult(
+        team_ids, users, range(first_task_id, first_task_id + task_count), row_count
+    )
+
+
+class _TaskRowGenerator:
+    """
+    업무 / 하위 업무 행을 모아 두었다가 flush 때 업무함 행과 함께 한 트랜잭션으로 넣습니다.
+
+    일시는 DB 에 저장되는 naive 값(now 기준)으로 받아 str() 로만 바꿉니다.
+    (connection.ops.adapt_datetimefield_value 를 행마다 부르지 않습니다.)
+    """
+
+    def __init__(self, next_task_id, next_sub_task_id, rng=None):
+        self.next_task_id = next_task_id
+        self.next_sub_task_id = next_sub_task_id
+        self.rng = rng
+        self.now = timezone.now()
+        if settings.USE_TZ:
+            self.now = timezone.make_naive(self.now, connection.timezone)
+        self.tasks, self.sub_tasks = [], []
+
+    def add(
+        self,
+        user,
+        title,
+        content,
+        created_at,
+        sub_task_team_ids,
+        complete_ratio=0.0,
+    ):
+        task_id = self.next_task_id
+        self.next_task_id += 1
+        adapted_created_at = str(created_at)
+
+        open_count = 0
+        last_completed_at = None
+        for team_id in sub_task_team_ids:
+            completed_at = None
+            if complete_ratio and self.rng.random() < complete_ratio:
+                completed_at = created_at + (self.now - created_at) * (
+                    self.rng.random() * 0.5
+                )
+                last_completed_at = max(last_completed_at or completed_at, completed_at)
+            else:
+                open_count += 1
+            self.sub_tasks.append(
+                (
+                    self.next_sub_task_id,
+                    adapted_created_at,
+                    adapted_created_at,
+                    task_id,
+                    team_id,
+                    completed_at is not None,
+                    completed_at and str(completed_at),
+                )
+            )
+            self.next_sub_task_id += 1
+
+        is_complete = bool(sub_task_team_ids) and open_count == 0
+        self.tasks.append(
+            (
+                task_id,
+                adapted_created_at,
+                adapted_created_at,
+                user.id,
+                user.team_id,
+                title,
+                content,
+                is_complete,
+                str(last_completed_at) if is_complete else None,
+                open_count,
+                0,
+            )
+        )
+
+    def flush(self):
+        if not self.tasks:
+            return 0
+
+        with transaction.atomic():
+            row_count = bulk_insert(Task, TASK_FIELDS, self.tasks)
+            row_count += bulk_insert(SubTask, SUB_TASK_FIELDS, self.sub_tasks)
+            row_count += insert_inbox_rows(
+                range(self.tasks[0][0], self.next_task_id),
+                range(
+                    self.next_sub_task_id - len(self.sub_tasks), self.next_sub_task_id
+                ),
+            )
+
+        self.tasks, self.sub_tasks = [], []
+        return row_count
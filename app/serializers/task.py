@@ -1,9 +1,13 @@
-from django.db import transaction
+from collections import Counter
+
+from django.db import DatabaseError, IntegrityError, connection, transaction
 from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from app.models import Task, SubTask, Team
+from app.cache import bump_team_task_versions
+from app.models import Task, SubTask, TeamTaskInbox
+from app.registry import team_registry
 
 
 class SubTaskSerializer(serializers.ModelSerializer):
@@ -38,19 +42,17 @@ class TaskSerializer(serializers.ModelSerializer):
         attrs = super().validate(attrs)
         user = self.context.get("request").user
 
-        if not user.team.id:
+        if not user.team_id:
             raise serializers.ValidationError(detail="유저-팀 정보가 존재하지 않습니다.")
 
-        attrs["create_user"] = user
-        attrs["team"] = user.team
+        attrs["create_user_id"] = user.id
+        attrs["team_id"] = user.team_id
 
         return attrs
 
 
 class CreateTaskSerializer(TaskSerializer):
-    team_ids = serializers.ListField(
-        child=serializers.PrimaryKeyRelatedField(queryset=Team.objects.all())
-    )
+    team_ids = serializers.ListField(child=serializers.IntegerField(min_value=1))
 
     class Meta:
         model = Task
@@ -73,6 +75,14 @@ class CreateTaskSerializer(TaskSerializer):
         if len(team_ids) != len(set(team_ids)):
             raise ValidationError("중복된 팀에게 중복으로 하위 업무를 부여할 수 없습니다.")
 
+        # 부여 대상 팀은 팀 레지스트리에서 한 번에 존재/인증 여부를 확인합니다.
+        teams = team_registry.get_many(team_ids)
+        if len(teams) != len(team_ids):
+            raise ValidationError("존재하지 않는 팀에게는 업무를 부여할 수 없습니다.")
+
+        if not all(team.is_verified for team in teams.values()):
+            raise ValidationError("유효하지 않은 팀에게는 업무를 부여할 수 없습니다.")
+
         return attrs
 
     def create(self, validated_data):
@@ -80,21 +90,199 @@ class CreateTaskSerializer(TaskSerializer):
         content = validated_data["content"]
         team_ids = validated_data["team_ids"]
         create_user = self.context.get("request").user
-        team = create_user.team
 
         with transaction.atomic():
             task = Task.objects.create(
-                create_user=create_user, team=team, title=title, content=content
+                create_user_id=create_user.id,
+                team_id=create_user.team_id,
+                title=title,
+                content=content,
+                open_sub_task_count=len(team_ids),
             )
-
-            for team in team_ids:
-                if not team.is_verified:
-                    raise ValidationError("유효하지 않은 팀에게는 업무를 부여할 수 없습니다.")
-                SubTask.objects.create(task=task, team=team)
+            SubTask.objects.bulk_create(
+                [SubTask(task=task, team_id=team_id) for team_id in team_ids]
+            )
+            TeamTaskInbox.objects.add_entries(task, [task.team_id] + team_ids)
+            bump_team_task_versions([task.team_id] + team_ids)
 
         return task
 
 
+class BulkTaskItemSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=100)
+    content = serializers.CharField()
+    team_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+
+    def validate_team_ids(self, team_ids):
+        if len(team_ids) != len(set(team_ids)):
+            raise ValidationError("중복된 팀에게 중복으로 하위 업무를 부여할 수 없습니다.")
+        return team_ids
+
+
+class BulkCreateTaskSerializer(serializers.Serializer):
+    MODE_ATOMIC = "atomic"
+    MODE_BEST_EFFORT = "best_effort"
+    MAX_TASKS = 5000
+    CHUNK_SIZE = 500
+
+    mode = serializers.ChoiceField(
+        label="처리 방식",
+        choices=[
+            (MODE_ATOMIC, "전체 성공 또는 전체 실패"),
+            (MODE_BEST_EFFORT, "가능한 업무만 생성"),
+        ],
+        default=MODE_ATOMIC,
+    )
+    tasks = serializers.ListField(
+        label="생성할 업무 목록",
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_TASKS,
+    )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        user = self.context.get("request").user
+        if not user.team_id:
+            raise ValidationError("유저-팀 정보가 존재하지 않습니다.")
+
+        items, results = [], []
+        for index, data in enumerate(attrs["tasks"]):
+            item_serializer = BulkTaskItemSerializer(data=data)
+            if not item_serializer.is_valid():
+                results.append(
+                    {
+                        "index": index,
+                        "status": "invalid",
+                        "errors": item_serializer.errors,
+                    }
+                )
+                continue
+            results.append({"index": index, "status": "pending"})
+            items.append((index, item_serializer.validated_data))
+
+        # 모든 업무의 부여 대상 팀을 팀 레지스트리에서 한 번에 확인합니다.
+        team_ids = {team_id for _, item in items for team_id in item["team_ids"]}
+        verified_team_ids = {
+            team.id
+            for team in team_registry.get_many(team_ids).values()
+            if team.is_verified
+        }
+
+        valid_items = []
+        for index, item in items:
+            if not verified_team_ids.issuperset(item["team_ids"]):
+                results[index] = {
+                    "index": index,
+                    "status": "invalid",
+                    "errors": {"team_ids": ["유효하지 않은 팀에게는 업무를 부여할 수 없습니다."]},
+                }
+                continue
+            valid_items.append((index, item))
+
+        attrs["items"] = valid_items
+        attrs["results"] = results
+
+        return attrs
+
+    def create(self, validated_data):
+        user = self.context.get("request").user
+        items = validated_data["items"]
+        results = validated_data["results"]
+        chunks = [
+            items[start : start + self.CHUNK_SIZE]
+            for start in range(0, len(items), self.CHUNK_SIZE)
+        ]
+
+        if validated_data["mode"] == self.MODE_ATOMIC:
+            if len(items) != len(results):
+                for result in results:
+                    if result["status"] == "pending":
+                        result["status"] = "skipped"
+                return results
+
+            with transaction.atomic():
+                for chunk in chunks:
+                    self._create_chunk(user, chunk, results)
+            return results
+
+        for chunk in chunks:
+            try:
+                with transaction.atomic():
+                    self._create_chunk(user, chunk, results)
+            except DatabaseError:
+                for index, _ in chunk:
+                    results[index] = {"index": index, "status": "failed"}
+
+        return results
+
+    def _create_chunk(self, user, chunk, results):
+        tasks = [
+            Task(
+                create_user_id=user.id,
+                team_id=user.team_id,
+                title=item["title"],
+                content=item["content"],
+                open_sub_task_count=len(item["team_ids"]),
+            )
+            for _, item in chunk
+        ]
+        tasks = self._insert_tasks(tasks)
+
+        SubTask.objects.bulk_create(
+            [
+                SubTask(task=task, team_id=team_id)
+                for task, (_, item) in zip(tasks, chunk)
+                for team_id in item["team_ids"]
+            ]
+        )
+        TeamTaskInbox.objects.bulk_create(
+            [
+                TeamTaskInbox(
+                    task=task, team_id=team_id, task_created_at=task.created_at
+                )
+                for task, (_, item) in zip(tasks, chunk)
+                for team_id in {task.team_id, *item["team_ids"]}
+            ]
+        )
+
+        bump_team_task_versions(
+            {
+                user.team_id,
+                *(team_id for _, item in chunk for team_id in item["team_ids"]),
+            }
+        )
+
+        for task, (index, _) in zip(tasks, chunk):
+            results[index] = {"index": index, "status": "created", "id": task.id}
+
+    @staticmethod
+    def _insert_tasks(tasks, attempts=3):
+        if connection.features.can_return_rows_from_bulk_insert:
+            return Task.objects.bulk_create(tasks)
+
+        # MySQL 은 bulk_create 로 생성된 pk 를 돌려주지 않으므로 pk 를 미리 정해 넣습니다.
+        # 마지막 업무 행을 잠가 동시에 실행되는 일괄 생성끼리는 같은 pk 를 쓰지 않고,
+        # 그 사이 한 건씩 생성된 업무와 pk 가 겹치면 다시 정합니다.
+        for attempt in range(attempts):
+            last_id = (
+                Task.objects.select_for_update()
+                .order_by("-id")
+                .values_list("id", flat=True)
+                .first()
+            )
+            for offset, task in enumerate(tasks, start=1):
+                task.id = (last_id or 0) + offset
+            try:
+                with transaction.atomic():
+                    return Task.objects.bulk_create(tasks)
+            except IntegrityError:
+                if attempt == attempts - 1:
+                    raise
+
+
 class UpdateTaskSerializer(TaskSerializer):
     class Meta:
         model = Task
@@ -102,10 +290,14 @@ class UpdateTaskSerializer(TaskSerializer):
 
     def update(self, instance, validated_data):
         updater = self.context.get("request").user
-        if instance.create_user != updater:
+        if instance.create_user_id != updater.id:
             raise ValidationError("작성자 본인만 업무내용 수정이 가능합니다.")
 
-        return super().update(instance, validated_data)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            bump_team_task_versions(TeamTaskInbox.objects.team_ids_for([instance.id]))
+
+        return instance
 
 
 class CompleteSubTaskSerializer(serializers.ModelSerializer):
@@ -114,14 +306,66 @@ class CompleteSubTaskSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
     def update(self, instance, validated_data):
-        task = instance.task
-        instance.is_complete = True
-        instance.completed_date = timezone.now()
-        instance.save()
+        completed_date = timezone.now()
+
+        with transaction.atomic():
+            completed = SubTask.objects.filter(
+                id=instance.id, is_complete=False
+            ).update(is_complete=True, completed_date=completed_date)
 
-        if task.sub_tasks.filter(is_complete=False).count() == 0:
-            task.is_complete = True
-            task.completed_date = timezone.now()
-            task.save()
+            if completed:
+                Task.objects.add_open_sub_task_count(instance.task_id, -1)
+                Task.objects.roll_up_completion([instance.task_id], completed_date)
+                bump_team_task_versions(
+                    TeamTaskInbox.objects.team_ids_for([instance.task_id])
+                )
+                instance.is_complete = True
+                instance.completed_date = completed_date
 
         return instance
+
+
+class CompleteSubTasksSerializer(serializers.Serializer):
+    MAX_SUB_TASKS = 1000
+
+    sub_task_ids = serializers.ListField(
+        label="완료할 하위 업무 id 목록",
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_SUB_TASKS,
+    )
+
+    def create(self, validated_data):
+        sub_task_ids = set(validated_data["sub_task_ids"])
+        team_id = self.context.get("request").user.team_id
+        completed_date = timezone.now()
+
+        with transaction.atomic():
+            # 확인한 하위 업무가 동시에 완료되지 않도록 잠근 채로 한 번에 조회합니다.
+            sub_tasks = list(
+                SubTask.objects.select_for_update()
+                .filter(id__in=sub_task_ids)
+                .values_list("id", "team_id", "task_id", "is_complete")
+            )
+            if len(sub_tasks) != len(sub_task_ids):
+                raise ValidationError("존재하지 않는 하위업무 입니다.")
+
+            if any(sub_task[1] != team_id for sub_task in sub_tasks):
+                raise ValidationError("업무팀에 소속되지 않은 팀은 완료 처리를 할 수 없습니다.")
+
+            open_sub_tasks = [sub_task for sub_task in sub_tasks if not sub_task[3]]
+            SubTask.objects.filter(
+                id__in=[sub_task[0] for sub_task in open_sub_tasks]
+            ).update(is_complete=True, completed_date=completed_date)
+
+            counts = Counter(sub_task[2] for sub_task in open_sub_tasks)
+            Task.objects.subtract_open_sub_task_counts(counts)
+            Task.objects.roll_up_completion(list(counts), completed_date)
+            if counts:
+                bump_team_task_versions(TeamTaskInbox.objects.team_ids_for(counts))
+
+        return {
+            "completed_sub_task_ids": sorted(
+                sub_task[0] for sub_task in open_sub_tasks
+            ),
+        }
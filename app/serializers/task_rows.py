@@ -0,0 +1,155 @@
+"""
+읽기 전용 업무 리스트의 빠른 직렬화 경로.
+
+ModelSerializer 의 필드별 처리 없이 `.values()` 결과로 TaskSerializer /
+SubTaskSerializer 와 같은 모양의 응답 행을 만듭니다.
+"""
+from collections import defaultdict
+
+from django.db import models
+from rest_framework import serializers
+
+from app.models import Task, SubTask
+from app.pagination import get_keyset_filter, get_position
+from app.serializers.task import TaskSerializer, SubTaskSerializer
+
+TASK_FIELDS = [name for name in TaskSerializer.Meta.fields if name != "sub_tasks"]
+SUB_TASK_FIELDS = list(SubTaskSerializer().fields)
+
+
+def _get_converters(model, field_names):
+    # 날짜/시간은 DRF DateTimeField 와 같은 문자열로 바꿔야 응답이 같아집니다.
+    datetime_field = serializers.DateTimeField()
+    return [
+        datetime_field.to_representation
+        if isinstance(model._meta.get_field(name), models.DateTimeField)
+        else None
+        for name in field_names
+    ]
+
+
+_TASK_CONVERTERS = list(zip(TASK_FIELDS, _get_converters(Task, TASK_FIELDS)))
+_SUB_TASK_CONVERTERS = _get_converters(SubTask, SUB_TASK_FIELDS)
+_SUB_TASK_ID_INDEX = SUB_TASK_FIELDS.index("id")
+_SUB_TASK_TASK_INDEX = SUB_TASK_FIELDS.index("task")
+
+# CSV 처럼 중첩을 표현할 수 없는 형식에서 하위 업무를 펼쳐 쓰는 열입니다.
+FLAT_SUB_TASK_COLUMNS = {
+    name: f"sub_task_{name}" for name in SUB_TASK_FIELDS if name != "task"
+}
+FLAT_TASK_HEADER = [*TASK_FIELDS, *FLAT_SUB_TASK_COLUMNS.values()]
+
+
+def build_task_row(task, sub_task_rows):
+    """
+    `.values()` 로 조회한 업무 dict 와 하위 업무 행으로 응답 행을 만듭니다.
+    """
+    row = {
+        name: converter(task[name]) if converter else task[name]
+        for name, converter in _TASK_CONVERTERS
+    }
+    row["sub_tasks"] = sub_task_rows
+
+    return row
+
+
+def build_sub_task_rows_by_task(sub_tasks):
+    """
+    SUB_TASK_FIELDS 순서의 하위 업무 튜플들을 한 번 순회하며 업무 id 별로 묶습니다.
+    """
+    rows = defaultdict(list)
+    for values in sub_tasks:
+        rows[values[_SUB_TASK_TASK_INDEX]].append(_build_sub_task_row(values))
+
+    return rows
+
+
+def _build_sub_task_row(values):
+    return {
+        name: converter(value) if converter else value
+        for name, converter, value in zip(SUB_TASK_FIELDS, _SUB_TASK_CONVERTERS, values)
+    }
+
+
+def _sub_tasks_of(task_ids):
+    return (
+        SubTask.objects.filter(task_id__in=task_ids)
+        .order_by("id")
+        .values_list(*SUB_TASK_FIELDS)
+    )
+
+
+def get_sub_task_rows_by_task(task_ids):
+    return build_sub_task_rows_by_task(_sub_tasks_of(task_ids))
+
+
+async def aget_sub_task_rows_by_task(task_ids):
+    return build_sub_task_rows_by_task(
+        [values async for values in _sub_tasks_of(task_ids)]
+    )
+
+
+def iter_task_rows(queryset, ordering, chunk_size):
+    """
+    업무를 ordering 키셋 순서로 chunk_size 씩 조회하며 응답 행을 하나씩 돌려줍니다.
+
+    MySQL 드라이버는 결과 전체를 클라이언트에 버퍼링하므로 `.iterator()` 대신
+    키셋 범위 조회로 나눠 가져오고, 하위 업무도 청크마다 한 번에 가져옵니다.
+    """
+    fields = [field.lstrip("-") for field in ordering]
+    queryset = queryset.values(*TASK_FIELDS, *fields).order_by(*ordering)
+
+    position = None
+    while True:
+        chunk_queryset = queryset
+        if position is not None:
+            chunk_queryset = queryset.filter(get_keyset_filter(ordering, position))
+        tasks = list(chunk_queryset[:chunk_size])
+        if not tasks:
+            return
+
+        sub_task_rows = get_sub_task_rows_by_task([task["id"] for task in tasks])
+        for task in tasks:
+            yield build_task_row(task, sub_task_rows.pop(task["id"], []))
+
+        if len(tasks) < chunk_size:
+            return
+        position = get_position(tasks[-1], fields)
+
+
+def iter_sub_task_rows(queryset, chunk_size):
+    """
+    하위 업무를 id 순서로 chunk_size 씩 조회하며 응답 행을 하나씩 돌려줍니다.
+    """
+    queryset = queryset.values_list(*SUB_TASK_FIELDS).order_by("id")
+
+    last_id = None
+    while True:
+        chunk_queryset = queryset
+        if last_id is not None:
+            chunk_queryset = queryset.filter(id__gt=last_id)
+        sub_tasks = list(chunk_queryset[:chunk_size])
+        if not sub_tasks:
+            return
+
+        for values in sub_tasks:
+            yield _build_sub_task_row(values)
+
+        if len(sub_tasks) < chunk_size:
+            return
+        last_id = sub_tasks[-1][_SUB_TASK_ID_INDEX]
+
+
+def flatten_task_rows(rows):
+    """
+    업무 행을 하위 업무 하나당 한 행으로 펼칩니다. 하위 업무가 없는 업무는 한 행으로 씁니다.
+    """
+    for row in rows:
+        task = {name: row[name] for name in TASK_FIELDS}
+        if not row["sub_tasks"]:
+            yield task
+        for sub_task in row["sub_tasks"]:
+            flat = dict(task)
+            for name, column in FLAT_SUB_TASK_COLUMNS.items():
+                flat[column] = sub_task[name]
+            yield flat
@@ -6,4 +6,4 @@ from app.models import Team
 class TeamSerializer(serializers.ModelSerializer):
     class Meta:
         model = Team
-        fields = "id"
+        fields = ["id", "team_name", "is_verified"]
@@ -0,0 +1,12 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+from app.authentication import TEAM_ID_CLAIM
+
+
+class TeamTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token[TEAM_ID_CLAIM] = user.team_id
+
+        return token
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -29,7 +30,7 @@ environ.Env.read_env(env_file=os.path.join(BASE_DIR, ".env"))
 SECRET_KEY = env("SECRET_KEY")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = env("DEBUG")
 
 ALLOWED_HOSTS = ["*"]
 
@@ -46,13 +47,16 @@ INSTALLED_APPS = [
     "app",
     "rest_framework",
     "rest_framework_simplejwt",
+    "django_filters",
     "drf_spectacular",
 ]
 
 MIDDLEWARE = [
+    "app.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "app.middleware.ReplicaRoutingMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -85,15 +89,55 @@ WSGI_APPLICATION = "app.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.mysql",
+        "ENGINE": "app.db.backends.mysql",
         "NAME": env("MYSQL_DATABASE"),
         "USER": env("MYSQL_USER"),
         "PASSWORD": env("MYSQL_PASSWORD"),
         "HOST": env("MYSQL_HOST"),
         "PORT": env("MYSQL_DATABASE_PORT"),
+        # 워커 프로세스마다 유지하는 커넥션 풀 (app/db/backends/mysql)
+        "POOL": {
+            "MAX_SIZE": env.int("DB_POOL_MAX_SIZE", default=10),
+            "TIMEOUT": env.int("DB_POOL_TIMEOUT", default=30),
+            "MAX_IDLE_TIME": env.int("DB_POOL_MAX_IDLE_TIME", default=300),
+        },
     }
 }
 
+# 읽기 전용 복제 DB (MYSQL_REPLICA_HOSTS=host1,host2)
+# 읽기 요청은 복제 DB 에서, 쓰기와 쓰기 직후 REPLICA_PIN_SECONDS 동안의 읽기는 primary 에서 처리합니다.
+DATABASE_REPLICAS = []
+for index, host in enumerate(env.list("MYSQL_REPLICA_HOSTS", default=[])):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["app.db.routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = env.int("REPLICA_PIN_SECONDS", default=5)
+
+
+# Cache
+# 여러 워커가 버전 스탬프를 공유하려면 CACHE_URL 로 memcached/redis 등 공유 캐시를 지정해야 합니다.
+# (DEBUG 가 아니면 app.checks 가 프로세스 로컬 캐시를 거부합니다.)
+# https://django-environ.readthedocs.io/en/latest/types.html#environ-env-cache-url
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# 팀 레지스트리(프로세스 로컬 팀 캐시) 설정
+TEAM_REGISTRY_MAX_SIZE = 10000
+TEAM_REGISTRY_VERSION_CHECK_INTERVAL = 5  # 초
+
+# 업무 직렬화 결과(프로세스 로컬) 캐시 최대 항목 수
+TASK_FRAGMENT_CACHE_MAX_SIZE = 50000
+
+# /metrics 접근 제한
+# METRICS_ALLOWED_IPS 에서 온 요청이나 "Authorization: Bearer <METRICS_TOKEN>" 요청만 응답합니다.
+METRICS_ALLOWED_IPS = env.list("METRICS_ALLOWED_IPS", default=["127.0.0.1", "::1"])
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -113,6 +157,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# 테스트는 비밀번호 해시 강도가 필요 없으므로 빠른 해시를 씁니다.
+TESTING = sys.argv[1:2] == ["test"]
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
@@ -138,9 +187,11 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+    "DEFAULT_RENDERER_CLASSES": (
+        "app.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("app.authentication.TeamJWTAuthentication",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
@@ -160,12 +211,13 @@ SIMPLE_JWT = {
     "LEEWAY": 0,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
-    "USER_ID_FIELD": "phone_number",
-    "USER_ID_CLAIM": "phone_number",
+    "USER_ID_FIELD": "id",
+    "USER_ID_CLAIM": "user_id",
     "USER_AUTHENTICATION_RULE": "rest_framework_simplejwt.authentication.default_user_authentication_rule",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
-    "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
+    "TOKEN_USER_CLASS": "app.authentication.TeamTokenUser",
+    "TOKEN_OBTAIN_SERIALIZER": "app.serializers.token.TeamTokenObtainPairSerializer",
     "JTI_CLAIM": "jti",
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
@@ -176,6 +228,9 @@ AUTH_USER_MODEL = "app.User"
 
 
 # drf-spectacular Setting
+# build_openapi_schema 로 만든 스키마 파일 (/schema/ 가 그대로 응답)
+OPENAPI_SCHEMA_FILE = os.path.join(BASE_DIR, "app", "openapi.yaml")
+
 SPECTACULAR_SETTINGS = {
     # General schema metadata. Refer to spec for valid inputs
     # https://github.com/OAI/OpenAPI-Specification/blob/master/versions/3.0.3.md#openapi-object
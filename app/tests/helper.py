@@ -1,8 +1,10 @@
 from collections import OrderedDict
 
+from django.contrib.auth.hashers import make_password
+from django.db.models import F, Max
 from faker import Faker
 
-from app.models import User, Team, Task, SubTask
+from app.models import User, Team, Task, SubTask, TeamTaskInbox
 
 locales = OrderedDict(
     [
@@ -51,6 +53,7 @@ def create_fake_task(
         is_complete=is_complete,
         completed_date=completed_date,
     )
+    TeamTaskInbox.objects.add_entries(task, [task.team_id])
 
     return task
 
@@ -66,5 +69,83 @@ def create_fake_sub_tasks(
     for team in teams:
         sub_task = SubTask.objects.create(team=team, task=task)
         sub_tasks.append(sub_task)
+    TeamTaskInbox.objects.add_entries(task, [team.id for team in teams])
+    Task.objects.add_open_sub_task_count(task.id, len(sub_tasks))
+
+    return sub_tasks
+
+
+def _next_ids(model, count):
+    # MySQL 의 bulk_create 는 pk 를 돌려주지 않으므로 pk 를 미리 정합니다.
+    first_id = (model.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+    return range(first_id, first_id + count)
+
+
+def bulk_create_fake_users(team: Team, count: int, password=None) -> ([User], str):
+    if not password:
+        password = fake.password()
+    password_hash = make_password(password)
+
+    users = User.objects.bulk_create(
+        User(id=user_id, user_name=fake.name(), password=password_hash, team=team)
+        for user_id in _next_ids(User, count)
+    )
+
+    return users, password
+
+
+def bulk_create_fake_tasks(
+    create_user: User,
+    count: int,
+    title: str = None,
+    content: str = None,
+    is_complete: bool = False,
+    completed_date: str = None,
+) -> [Task]:
+    # Faker 는 행마다 호출하기에는 느리므로 한 번 만든 제목 / 내용을 같이 씁니다.
+    title = title or fake.paragraph(nb_sentences=1)
+    content = content or fake.paragraph(nb_sentences=5)
+    tasks = Task.objects.bulk_create(
+        Task(
+            id=task_id,
+            create_user=create_user,
+            team=create_user.team,
+            title=title,
+            content=content,
+            is_complete=is_complete,
+            completed_date=completed_date,
+        )
+        for task_id in _next_ids(Task, count)
+    )
+    TeamTaskInbox.objects.bulk_create(
+        TeamTaskInbox(team_id=task.team_id, task=task, task_created_at=task.created_at)
+        for task in tasks
+    )
+
+    return tasks
+
+
+def bulk_create_fake_sub_tasks(teams: [Team], tasks: [Task]) -> [SubTask]:
+    """
+    업무마다 teams 의 각 팀에 하위 업무를 부여합니다.
+    """
+    sub_task_ids = iter(_next_ids(SubTask, len(teams) * len(tasks)))
+    sub_tasks = SubTask.objects.bulk_create(
+        SubTask(id=next(sub_task_ids), team=team, task=task)
+        for task in tasks
+        for team in teams
+    )
+    TeamTaskInbox.objects.bulk_create(
+        [
+            TeamTaskInbox(team=team, task=task, task_created_at=task.created_at)
+            for task in tasks
+            for team in teams
+        ],
+        ignore_conflicts=True,
+    )
+    Task.objects.filter(id__in=[task.id for task in tasks]).update(
+        open_sub_task_count=F("open_sub_task_count") + len(teams),
+        sub_task_version=F("sub_task_version") + 1,
+    )
 
     return sub_tasks
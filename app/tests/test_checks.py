@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase, override_settings
+
+from app.checks import check_shared_cache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379/0",
+    }
+}
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    @override_settings(DEBUG=False, TESTING=False, CACHES=LOCMEM)
+    def test_reject_local_cache_without_debug(self):
+        (error,) = check_shared_cache(None)
+        self.assertEqual(error.id, "app.E001")
+
+    @override_settings(DEBUG=False, TESTING=False, CACHES=REDIS)
+    def test_accept_shared_cache(self):
+        self.assertEqual(check_shared_cache(None), [])
+
+    @override_settings(DEBUG=True, TESTING=False, CACHES=LOCMEM)
+    def test_accept_local_cache_in_debug(self):
+        self.assertEqual(check_shared_cache(None), [])
@@ -0,0 +1,113 @@
+import random
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from rest_framework.test import APITestCase
+
+from app.cache import get_team_task_version, task_fragment_cache
+from app.constants.task import TEAM_NAMES
+from app.management.commands.benchmark_task_api import Command as BenchmarkCommand
+from app.models import User, Team, Task, SubTask, TeamTaskInbox
+from app.registry import team_registry
+from app.tests.helper import create_fake_sub_tasks, create_fake_task, create_fake_team
+from scripts.create_base_data import create_team_and_user
+
+
+class CommandTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_team_and_user(TEAM_NAMES)
+
+    def setUp(self) -> None:
+        cache.clear()
+        team_registry.clear()
+        task_fragment_cache.clear()
+
+    def test_rebuild_team_task_inbox(self):
+        task_user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=task_user)
+        sub_task_teams = list(Team.objects.exclude(id=task_user.team_id)[:2])
+        create_fake_sub_tasks(teams=sub_task_teams, task=task)
+        expect_team_ids = sorted([task_user.team_id] + [t.id for t in sub_task_teams])
+
+        stale_team = create_fake_team()
+        TeamTaskInbox.objects.filter(task=task, team=sub_task_teams[0]).delete()
+        TeamTaskInbox.objects.create(
+            task=task, team=stale_team, task_created_at=task.created_at
+        )
+
+        call_command("rebuild_team_task_inbox", chunk_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            sorted(task.team_inbox.values_list("team_id", flat=True)),
+            expect_team_ids,
+        )
+
+    def test_reconcile_open_sub_task_counts(self):
+        user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=user)
+        sub_tasks = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=3), task=task
+        )
+        SubTask.objects.filter(id=sub_tasks[0].id).update(is_complete=True)
+        Task.objects.filter(id=task.id).update(open_sub_task_count=10)
+
+        call_command("reconcile_open_sub_task_counts", chunk_size=1, stdout=StringIO())
+
+        task.refresh_from_db()
+        self.assertEqual(task.open_sub_task_count, 2)
+        self.assertFalse(task.is_complete)
+
+    def test_reconcile_completes_tasks_without_open_sub_tasks(self):
+        user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=user)
+        sub_tasks = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=2), task=task
+        )
+        # 하위 업무 완료가 업무에 반영되지 않은 상태
+        SubTask.objects.filter(id__in=[s.id for s in sub_tasks]).update(
+            is_complete=True
+        )
+        version = get_team_task_version(user.team_id)
+
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("reconcile_open_sub_task_counts", stdout=out)
+
+        self.assertIn("완료 처리 1건", out.getvalue())
+        task.refresh_from_db()
+        self.assertEqual(task.open_sub_task_count, 0)
+        self.assertTrue(task.is_complete)
+        self.assertIsNotNone(task.completed_date)
+        self.assertNotEqual(get_team_task_version(user.team_id), version)
+
+    def test_benchmark_skips_endpoints_with_too_few_requests(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_task_api", requests=1)
+
+        for count in [0, 1]:
+            stats = BenchmarkCommand._measure([HttpResponse] * count)
+            self.assertEqual(stats, {"requests": count, "skipped": True})
+
+        stats = BenchmarkCommand._measure([HttpResponse] * 2)
+        self.assertEqual(stats["requests"], 2)
+        self.assertIn("p99_ms", stats)
+
+    def test_benchmark_task_list(self):
+        task_count = Task.objects.count()
+        out, err = StringIO(), StringIO()
+        call_command(
+            "benchmark_task_list",
+            tasks=5,
+            sub_tasks=2,
+            repeat=1,
+            stdout=out,
+            stderr=err,
+        )
+
+        self.assertEqual(err.getvalue(), "")
+        self.assertIn("배 빠름", out.getvalue())
+        # 벤치마크용 데이터는 롤백됩니다.
+        self.assertEqual(Task.objects.count(), task_count)
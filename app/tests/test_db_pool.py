@@ -0,0 +1,135 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from app.db import pool as pool_module
+from app.db.pool import ConnectionPool, PoolTimeout, get_pool, get_pool_key
+
+
+class FakeConnection:
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+
+    def ping(self):
+        if not self.alive:
+            raise ConnectionError("끊어진 커넥션")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def _create_pool(self, **options):
+        self.clock = FakeClock()
+        return ConnectionPool(
+            FakeConnection,
+            health_check=FakeConnection.ping,
+            clock=self.clock,
+            **options,
+        )
+
+    def test_reuse_released_connection(self):
+        pool = self._create_pool(max_size=2)
+
+        connection = pool.acquire()
+        pool.release(connection)
+        self.assertIs(pool.acquire(), connection)
+
+        stats = pool.stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["in_use"], 1)
+
+    def test_discard_unhealthy_and_idle_connection(self):
+        pool = self._create_pool(max_size=2, max_idle_time=60)
+
+        dead = pool.acquire()
+        pool.release(dead)
+        dead.alive = False
+        self.assertIsNot(pool.acquire(), dead)
+        self.assertTrue(dead.closed)
+
+        idle = pool.acquire()
+        pool.release(idle)
+        self.clock.now += 61
+        self.assertIsNot(pool.acquire(), idle)
+        self.assertTrue(idle.closed)
+
+        stats = pool.stats()
+        self.assertEqual(stats["discards"], 2)
+        self.assertEqual(stats["size"], 2)
+
+    def test_wait_for_released_connection(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, timeout=5)
+        connection = pool.acquire()
+
+        acquired = []
+        waiting = threading.Event()
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+
+        # 대기자는 락을 잡은 채로 시계를 보고 wait() 에서 락을 놓으므로,
+        # 시계를 본 뒤에 반납하면 대기를 시작한 뒤에 반납됩니다.
+        def clock():
+            if threading.current_thread() is waiter:
+                waiting.set()
+            return time.monotonic()
+
+        pool.clock = clock
+        waiter.start()
+        self.assertTrue(waiting.wait(timeout=5))
+        pool.release(connection)
+        waiter.join(timeout=5)
+
+        self.assertEqual(acquired, [connection])
+        self.assertEqual(pool.stats()["created"], 1)
+
+    def test_fail_acquire_when_pool_is_full(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, timeout=0)
+        pool.acquire()
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        self.assertEqual(pool.stats()["waits"], 1)
+
+
+class GetPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pools = pool_module._pools.copy()
+        pool_module._pools.clear()
+
+    def tearDown(self):
+        pool_module._pools.clear()
+        pool_module._pools.update(self.pools)
+
+    def test_rebuild_pool_when_connection_settings_change(self):
+        key = get_pool_key({"db": "app", "host": "db"}, {"MAX_SIZE": 2})
+        self.assertEqual(
+            key, get_pool_key({"host": "db", "db": "app"}, {"MAX_SIZE": 2})
+        )
+        pool = get_pool("default", FakeConnection, key=key)
+        self.assertIs(get_pool("default", FakeConnection, key=key), pool)
+
+        idle, in_use = pool.acquire(), pool.acquire()
+        pool.release(idle)
+
+        # 테스트 실행기가 NAME 을 test_ DB 로 바꾼 경우
+        test_key = get_pool_key({"db": "test_app", "host": "db"}, {"MAX_SIZE": 2})
+        self.assertNotEqual(test_key, key)
+        test_pool = get_pool("default", FakeConnection, key=test_key)
+        self.assertIsNot(test_pool, pool)
+        self.assertTrue(idle.closed)
+
+        # 이전 풀에서 꺼내 둔 커넥션은 반납할 때 닫습니다.
+        pool.release(in_use)
+        self.assertTrue(in_use.closed)
+        self.assertEqual(pool.stats()["size"], 0)
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from app.authentication import TEAM_ID_CLAIM
+from app.cache import new_version
+from app.db.routers import ReplicaRouter, read_from_replica
+from app.middleware import ReplicaRoutingMiddleware
+from app.models import Task
+from app.views.task import TaskListMixin
+
+
+@override_settings(DATABASE_REPLICAS=["replica_0"], REPLICA_PIN_SECONDS=5)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.router = ReplicaRouter()
+        self.routed = {}
+
+        def get_response(request):
+            self.routed["read"] = self.router.db_for_read(Task)
+            self.routed["write"] = self.router.db_for_write(Task)
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(get_response)
+        cache.clear()
+
+    def get_auth_header(self, user_id):
+        token = AccessToken()
+        token["user_id"] = user_id
+        token[TEAM_ID_CLAIM] = 1
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def test_read_from_replica_only_in_safe_request(self):
+        self.middleware(RequestFactory().get("/tasks/"))
+        self.assertEqual(self.routed, {"read": "replica_0", "write": "default"})
+
+        self.middleware(RequestFactory().post("/tasks/"))
+        self.assertEqual(self.routed, {"read": "default", "write": "default"})
+
+        # 요청 밖(관리 명령 등)에서는 primary 에서 읽습니다.
+        self.assertEqual(self.router.db_for_read(Task), "default")
+
+    def test_read_from_primary_after_write(self):
+        response = self.middleware(RequestFactory().post("/tasks/"))
+        cookie = response.cookies[ReplicaRoutingMiddleware.cookie_name]
+        self.assertEqual(cookie["max-age"], 5)
+
+        request = RequestFactory().get("/tasks/")
+        request.COOKIES[cookie.key] = cookie.value
+        self.middleware(request)
+        self.assertEqual(self.routed["read"], "default")
+
+    def test_read_from_primary_after_write_with_token(self):
+        self.middleware(RequestFactory().post("/tasks/", **self.get_auth_header(1)))
+
+        # 쿠키를 보내지 않아도 같은 유저의 읽기는 primary 에서 읽습니다.
+        self.middleware(RequestFactory().get("/tasks/", **self.get_auth_header(1)))
+        self.assertEqual(self.routed["read"], "default")
+
+        self.middleware(RequestFactory().get("/tasks/", **self.get_auth_header(2)))
+        self.assertEqual(self.routed["read"], "replica_0")
+
+    def test_read_from_replica_while_streaming(self):
+        def stream():
+            for _ in range(2):
+                yield self.router.db_for_read(Task)
+
+        middleware = ReplicaRoutingMiddleware(
+            lambda request: StreamingHttpResponse(stream())
+        )
+        response = middleware(RequestFactory().get("/tasks/export/"))
+        self.assertEqual(list(response), [b"replica_0", b"replica_0"])
+
+        request = RequestFactory().get("/tasks/export/")
+        request.COOKIES[ReplicaRoutingMiddleware.cookie_name] = "1"
+        response = middleware(request)
+        self.assertEqual(list(response), [b"default", b"default"])
+
+    @patch("app.cache.time.time")
+    def test_read_list_from_primary_after_version_bump(self, now):
+        now.return_value = 1000.0
+        version = new_version()
+
+        with read_from_replica(True):
+            with TaskListMixin().read_list_from(version):
+                self.assertEqual(self.router.db_for_read(Task), "default")
+
+            # REPLICA_PIN_SECONDS 가 지나면 다시 복제 DB 에서 읽습니다.
+            now.return_value = 1005.0
+            with TaskListMixin().read_list_from(version):
+                self.assertEqual(self.router.db_for_read(Task), "replica_0")
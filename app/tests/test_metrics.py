@@ -0,0 +1,86 @@
+import random
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.cache import task_fragment_cache
+from app.constants.task import TEAM_NAMES
+from app.models import User
+from app.registry import team_registry
+from app.serializers.token import TeamTokenObtainPairSerializer
+from app.tests.helper import create_fake_task
+from scripts.create_base_data import create_team_and_user
+
+
+class MetricsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_team_and_user(TEAM_NAMES)
+
+    def setUp(self) -> None:
+        cache.clear()
+        team_registry.clear()
+        task_fragment_cache.clear()
+
+    def test_request_metrics(self):
+        user = random.choice(User.objects.all())
+        create_fake_task(create_user=user)
+        self.client.force_authenticate(user=user)
+
+        resp = self.client.get(reverse("task-list"), HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn("db;dur=", resp["Server-Timing"])
+        self.assertIn('desc="2 queries"', resp["Server-Timing"])
+        self.assertIn("serialize;dur=", resp["Server-Timing"])
+
+        token = TeamTokenObtainPairSerializer.get_token(user).access_token
+        resp = async_to_sync(self.async_client.get)(
+            reverse("async-task-list"), AUTHORIZATION=f"Bearer {token}"
+        )
+        # 하위 업무는 위 요청에서 캐시되어 업무 조회 1번만 합니다.
+        self.assertIn('desc="1 queries"', resp["Server-Timing"])
+
+        resp = self.client.get(reverse("metrics"))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        content = resp.content.decode()
+        self.assertIn('app_request_db_queries_total{route="^tasks/$"}', content)
+        self.assertIn(
+            'app_request_serialize_duration_seconds_count{route="async/tasks/"}',
+            content,
+        )
+        self.assertIn(
+            'app_request_duration_seconds_count{method="GET",route="async/tasks/",'
+            'status="200"}',
+            content,
+        )
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"], METRICS_TOKEN="secret")
+    def test_metrics_only_for_allowed_ips_or_token(self):
+        url = reverse("metrics")
+        self.assertEqual(
+            self.client.get(url, REMOTE_ADDR="10.0.0.1").status_code,
+            status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            self.client.get(url, REMOTE_ADDR="10.0.0.2").status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        for authorization, status_code in [
+            ("Bearer secret", status.HTTP_200_OK),
+            ("Bearer wrong", status.HTTP_404_NOT_FOUND),
+        ]:
+            resp = self.client.get(
+                url, REMOTE_ADDR="10.0.0.2", HTTP_AUTHORIZATION=authorization
+            )
+            self.assertEqual(resp.status_code, status_code)
+
+        # 토큰을 설정하지 않으면 빈 토큰으로도 접근할 수 없습니다.
+        with self.settings(METRICS_TOKEN=""):
+            resp = self.client.get(
+                url, REMOTE_ADDR="10.0.0.2", HTTP_AUTHORIZATION="Bearer "
+            )
+            self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,52 @@
+import os
+import re
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.conf import settings
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.views.schema import load_schema
+
+
+class SchemaTests(APITestCase):
+    def test_openapi_schema_file_is_up_to_date(self):
+        # 실패하면 python manage.py build_openapi_schema 로 스키마 파일을 다시 만듭니다.
+        call_command("build_openapi_schema", "--check", stdout=StringIO())
+
+        # operationId 가 겹치면 번호가 붙어 생성되는 클라이언트의 메서드 이름이 바뀝니다.
+        with open(settings.OPENAPI_SCHEMA_FILE) as f:
+            schema = f.read()
+        # Swagger 의 Authorize 에 쓰이는 Bearer 인증 방식
+        self.assertIn("securitySchemes:\n    jwtAuth:", schema)
+        operation_ids = re.findall(r"operationId: (\S+)", schema)
+        self.assertEqual(len(operation_ids), len(set(operation_ids)))
+        self.assertFalse([name for name in operation_ids if re.search(r"_\d+$", name)])
+
+    def test_success_get_precomputed_schema(self):
+        resp = self.client.get(reverse("schema"))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIn("max-age", resp["Cache-Control"])
+        with open(settings.OPENAPI_SCHEMA_FILE, "rb") as f:
+            self.assertEqual(resp.content, f.read())
+
+        with self.assertNumQueries(0):
+            resp = self.client.get(reverse("schema"), HTTP_IF_NONE_MATCH=resp["ETag"])
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_load_schema_only_caches_existing_file(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "openapi.yaml")
+            self.assertIsNone(load_schema(path))
+
+            # 파일이 없던 결과는 저장하지 않으므로 나중에 만든 파일을 읽습니다.
+            with open(path, "wb") as f:
+                f.write(b"openapi: 3.0.3")
+            content, etag = load_schema(path)
+            self.assertEqual(content, b"openapi: 3.0.3")
+
+            os.remove(path)
+            self.assertEqual(load_schema(path), (content, etag))
@@ -0,0 +1,105 @@
+from collections import Counter
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from app.cache import get_version, task_fragment_cache
+from app.constants.task import TEAM_NAMES
+from app.models import User, Team, Task, SubTask
+from app.models.team import TEAM_REGISTRY_VERSION_KEY
+from app.registry import team_registry
+from app.seed import create_teams_and_users, seed_tasks
+from app.tests.helper import (
+    bulk_create_fake_sub_tasks,
+    bulk_create_fake_tasks,
+    bulk_create_fake_users,
+    create_fake_team,
+)
+from scripts.create_base_data import create_team_and_user
+
+
+class SeedTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_team_and_user(TEAM_NAMES)
+
+    def setUp(self) -> None:
+        cache.clear()
+        team_registry.clear()
+        task_fragment_cache.clear()
+
+    def test_seed_tasks_keeps_denormalized_data_consistent(self):
+        seeded = seed_tasks(
+            team_count=4, tasks_per_team=5, sub_tasks_per_task=2, password="1234"
+        )
+        self.assertEqual(len(seeded.task_ids), 20)
+        self.assertEqual(
+            SubTask.objects.filter(task_id__in=seeded.task_ids).count(), 40
+        )
+
+        for command in ["rebuild_team_task_inbox", "reconcile_open_sub_task_counts"]:
+            out = StringIO()
+            call_command(command, stdout=out)
+            self.assertRegex(out.getvalue(), r"(0건 추가, 0건 삭제|: 0건)")
+
+        user = seeded.users[0]
+        self.assertTrue(User.objects.get(id=user.id).check_password("1234"))
+
+    def test_bulk_factories_keep_denormalized_data_consistent(self):
+        team = create_fake_team(is_verified=True)
+        users, password = bulk_create_fake_users(team, 3)
+        tasks = bulk_create_fake_tasks(users[0], 10)
+        bulk_create_fake_sub_tasks(list(Team.objects.all()[:2]), tasks)
+
+        self.assertTrue(User.objects.get(id=users[-1].id).check_password(password))
+        for command in ["rebuild_team_task_inbox", "reconcile_open_sub_task_counts"]:
+            out = StringIO()
+            call_command(command, stdout=out)
+            self.assertRegex(out.getvalue(), r"(0건 추가, 0건 삭제|: 0건)")
+
+    def test_seed_data_command_is_skewed_and_deterministic(self):
+        def seed():
+            out = StringIO()
+            call_command(
+                "seed_data",
+                teams=5,
+                users=20,
+                tasks=300,
+                seed=7,
+                batch_size=100,
+                stdout=out,
+            )
+            self.assertIn("생성 완료", out.getvalue())
+            tasks = Task.objects.order_by("-id")[:300]
+            return [
+                (task.title, task.sub_tasks.count(), task.is_complete)
+                for task in tasks.prefetch_related("sub_tasks")
+            ]
+
+        first = seed()
+        self.assertEqual(first, seed())
+
+        for command in ["rebuild_team_task_inbox", "reconcile_open_sub_task_counts"]:
+            out = StringIO()
+            call_command(command, stdout=out)
+            self.assertRegex(out.getvalue(), r"(0건 추가, 0건 삭제|: 0건)")
+
+        # 업무는 일부 유저에 몰리고, 하위 업무는 적을수록 흔합니다.
+        owner_counts = Counter(
+            Task.objects.order_by("-id")[:300].values_list("create_user_id", flat=True)
+        )
+        ((_, top_count),) = owner_counts.most_common(1)
+        self.assertGreater(top_count, 300 / 20 * 2)
+        sub_task_counts = [count for _, count, _ in first]
+        self.assertGreater(sub_task_counts.count(0), sub_task_counts.count(3))
+
+    def test_create_teams_and_users_invalidates_team_registry(self):
+        version = get_version(TEAM_REGISTRY_VERSION_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            team_ids, _ = create_teams_and_users(["시드 팀"], password="1234")
+        team_registry._checked_at = 0.0
+
+        self.assertNotEqual(get_version(TEAM_REGISTRY_VERSION_KEY), version)
+        self.assertEqual(team_registry.get(team_ids[0]).team_name, "시드 팀")
@@ -1,27 +1,60 @@
+import base64
+import csv
+import json
 import random
+import re
+from decimal import Decimal
+from importlib import import_module
+from io import StringIO
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlencode, urlparse
+from unittest.mock import patch
 
-from django.db.models import Q
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, connection
+from django.db.models import DecimalField, Prefetch, Q, Value
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APITransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken
 
 from app.constants.task import TEAM_NAMES
-from app.models import User, Team, Task, SubTask
+from app.models import User, Team, Task, SubTask, TeamTaskInbox
+from app.pagination import KeysetCursorPagination, get_position
+from app.cache import task_fragment_cache
+from app.registry import team_registry
+from app.serializers.task import CompleteSubTaskSerializer, TaskSerializer
+from app.serializers.token import TeamTokenObtainPairSerializer
 from app.tests.helper import (
     fake,
+    bulk_create_fake_sub_tasks,
+    bulk_create_fake_tasks,
     create_fake_task,
     create_fake_sub_tasks,
     create_fake_team,
     create_fake_user,
 )
+from app.views.task import SubTaskViewSet, TaskViewSet
 from scripts.create_base_data import create_team_and_user
 
 
 class TaskTests(APITestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls):
         create_team_and_user(TEAM_NAMES)
 
+    def setUp(self) -> None:
+        cache.clear()
+        team_registry.clear()
+        task_fragment_cache.clear()
+
     def _test_get_tasks(
         self,
         expect_status_code: int,
@@ -36,7 +69,8 @@ class TaskTests(APITestCase):
         resp_json = resp.json()
         if expect_status_code == status.HTTP_200_OK:
             sorted_task_id_list = [
-                task["id"] for task in sorted(resp_json, key=lambda x: x["id"])
+                task["id"]
+                for task in sorted(resp_json["results"], key=lambda x: x["id"])
             ]
             self.assertIsNotNone(resp_json)
             self.assertEqual(sorted_task_id_list, sorted(expect_task_id_list))
@@ -199,9 +233,7 @@ class TaskTests(APITestCase):
         not_completed_sub_task, completed_sub_task = create_fake_sub_tasks(
             teams=sub_task_teams, task=task
         )
-        completed_sub_task.is_complete = True
-        completed_sub_task.completed_date = timezone.now()
-        completed_sub_task.save()
+        CompleteSubTaskSerializer().update(completed_sub_task, {})
 
         sub_task_user = User.objects.filter(team=not_completed_sub_task.team).first()
 
@@ -273,6 +305,66 @@ class TaskTests(APITestCase):
             user=task_user,
         )
 
+    def test_delete_last_open_sub_task_completes_task(self):
+        task_user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=task_user)
+        completed_sub_task, open_sub_task = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=2), task=task
+        )
+        CompleteSubTaskSerializer().update(completed_sub_task, {})
+
+        self._test_delete_sub_task(
+            expect_status_code=status.HTTP_204_NO_CONTENT,
+            task_id=task.id,
+            delete_sub_task_id=open_sub_task.id,
+            user=task_user,
+        )
+        task.refresh_from_db()
+        self.assertEqual(task.open_sub_task_count, 0)
+        self.assertTrue(task.is_complete)
+        self.assertIsNotNone(task.completed_date)
+
+    def test_fail_delete_sub_task_completed_after_lookup(self):
+        task_user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=task_user)
+        sub_task, _ = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=2), task=task
+        )
+        get_object = SubTaskViewSet.get_object
+
+        # 조회한 뒤 삭제하기 전에 다른 요청이 완료 처리한 경우
+        def get_object_then_complete(view):
+            instance = get_object(view)
+            CompleteSubTaskSerializer().update(instance, {})
+            instance.is_complete = False
+            return instance
+
+        with patch.object(SubTaskViewSet, "get_object", get_object_then_complete):
+            self._test_delete_sub_task(
+                expect_status_code=status.HTTP_400_BAD_REQUEST,
+                task_id=task.id,
+                delete_sub_task_id=sub_task.id,
+                user=task_user,
+            )
+        task.refresh_from_db()
+        self.assertEqual(task.open_sub_task_count, 1)
+        self.assertTrue(SubTask.objects.filter(id=sub_task.id).exists())
+
+    def test_fail_update_sub_task(self):
+        user, other_user = User.objects.order_by("id")[:2]
+        task = create_fake_task(create_user=user)
+        (sub_task,) = create_fake_sub_tasks(teams=[other_user.team], task=task)
+
+        self.client.force_authenticate(user=user)
+        url = reverse("sub-task-detail", kwargs={"task_id": task.id, "pk": sub_task.id})
+        for method in [self.client.put, self.client.patch]:
+            resp = method(url, {"is_complete": True, "team": user.team_id})
+            self.assertEqual(resp.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        sub_task.refresh_from_db()
+        self.assertEqual(sub_task.team_id, other_user.team_id)
+        self.assertFalse(sub_task.is_complete)
+
     def test_fail_delete_completed_sub_task(self):
         task_user = random.choice(User.objects.all())
         task = create_fake_task(create_user=task_user)
@@ -343,3 +435,876 @@ class TaskTests(APITestCase):
         self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
         add_sub_task = SubTask.objects.filter(task=task, team=add_team).first()
         self.assertIsNotNone(add_sub_task)
+
+    def test_success_get_tasks_by_cursor(self):
+        user = random.choice(User.objects.all())
+        tasks = bulk_create_fake_tasks(user, 5)
+        # 생성일시가 같은 업무도 id 로 순서가 보장되어야 합니다.
+        same_created_at = timezone.now()
+        Task.objects.filter(id__in=[task.id for task in tasks[1:4]]).update(
+            created_at=same_created_at
+        )
+        TeamTaskInbox.objects.filter(task__in=tasks[1:4]).update(
+            task_created_at=same_created_at
+        )
+        expect_task_ids = [
+            task.id for task in Task.objects.order_by("-created_at", "-id")
+        ]
+
+        self.client.force_authenticate(user=user)
+        url = reverse("task-list") + "?page_size=2"
+        pages = []
+        while url:
+            resp = self.client.get(url, HTTP_ACCEPT="application/json")
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            resp_json = resp.json()
+            pages.append([task["id"] for task in resp_json["results"]])
+            url = resp_json["next"]
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), expect_task_ids)
+
+        resp = self.client.get(resp_json["previous"], HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([task["id"] for task in resp.json()["results"]], pages[1])
+
+        resp = self.client.get(
+            reverse("task-list") + "?cursor=invalid", HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 형식은 맞지만 값이 정렬 필드 타입과 맞지 않는 커서
+        for position in [["not-a-date", "x"], [None, 1], [[], {}]]:
+            cursor = base64.urlsafe_b64encode(
+                json.dumps({"p": position, "r": 0}).encode()
+            ).decode()
+            with self.subTest(position=position):
+                resp = self.client.get(
+                    reverse("task-list"),
+                    {"cursor": cursor},
+                    HTTP_ACCEPT="application/json",
+                )
+                self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filter_tasks(self):
+        user, other_user = User.objects.order_by("id")[:2]
+        self.client.force_authenticate(user=user)
+        completed_date = timezone.now() - timezone.timedelta(days=3)
+
+        owned_open = create_fake_task(create_user=user)
+        create_fake_sub_tasks(teams=[other_user.team], task=owned_open)
+        owned_complete = create_fake_task(
+            create_user=user, is_complete=True, completed_date=completed_date
+        )
+        assigned_open = create_fake_task(create_user=other_user)
+        create_fake_sub_tasks(teams=[user.team], task=assigned_open)
+        assigned_done = create_fake_task(create_user=other_user)
+        (sub_task,) = create_fake_sub_tasks(teams=[user.team], task=assigned_done)
+        SubTask.objects.filter(id=sub_task.id).update(
+            is_complete=True, completed_date=completed_date
+        )
+        Task.objects.add_open_sub_task_count(assigned_done.id, -1)
+
+        all_tasks = [owned_open, owned_complete, assigned_open, assigned_done]
+        for query, expected_tasks in [
+            ("", all_tasks),
+            ("is_complete=true", [owned_complete]),
+            ("role=owner", [owned_open, owned_complete]),
+            ("role=assignee", [assigned_open, assigned_done]),
+            ("role=owner&is_complete=false", [owned_open]),
+            ("has_open_sub_tasks=true", [owned_open, assigned_open]),
+            ("sub_task_is_complete=true", [assigned_done]),
+            ("sub_task_is_complete=false", [assigned_open]),
+            (
+                "completed_date_before="
+                + (completed_date + timezone.timedelta(days=1)).isoformat(),
+                [owned_complete],
+            ),
+            ("created_at_after=2000-01-01T00:00:00Z", all_tasks),
+            ("created_at_before=2000-01-01T00:00:00Z", []),
+        ]:
+            with self.subTest(query=query):
+                resp = self.client.get(
+                    reverse("task-list") + "?" + query.replace("+", "%2B"),
+                    HTTP_ACCEPT="application/json",
+                )
+                self.assertEqual(resp.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    sorted(task["id"] for task in resp.json()["results"]),
+                    sorted(task.id for task in expected_tasks),
+                )
+
+        resp = self.client.get(reverse("task-list") + "?role=unknown")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        token = TeamTokenObtainPairSerializer.get_token(user).access_token
+        resp = async_to_sync(self.async_client.get)(
+            reverse("async-task-list") + "?role=assignee",
+            AUTHORIZATION=f"Bearer {token}",
+        )
+        self.assertEqual(
+            sorted(task["id"] for task in resp.json()["results"]),
+            [assigned_open.id, assigned_done.id],
+        )
+
+    def test_get_tasks_query_count_is_constant(self):
+        user = random.choice(User.objects.all())
+        sub_task_teams = list(Team.objects.all()[:3])
+        self.client.force_authenticate(user=user)
+
+        created_count = 0
+        for task_count in [10, 100, 1000]:
+            tasks = bulk_create_fake_tasks(user, task_count - created_count)
+            bulk_create_fake_sub_tasks(sub_task_teams, tasks)
+            created_count = task_count
+
+            with self.subTest(task_count=task_count):
+                with self.assertNumQueries(2):
+                    resp = self.client.get(
+                        reverse("task-list") + f"?page_size={task_count}",
+                        HTTP_ACCEPT="application/json",
+                    )
+                self.assertEqual(resp.status_code, status.HTTP_200_OK)
+                results = resp.json()["results"]
+                self.assertEqual(len(results), task_count)
+                self.assertTrue(
+                    all(
+                        len(task["sub_tasks"]) == len(sub_task_teams)
+                        for task in results
+                    )
+                )
+
+                with self.assertNumQueries(2):
+                    resp = self.client.get(
+                        reverse("task-detail", kwargs={"pk": results[0]["id"]}),
+                        HTTP_ACCEPT="application/json",
+                    )
+                self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_team_task_inbox_follows_sub_task_changes(self):
+        task_user = random.choice(User.objects.all())
+        add_team = Team.objects.exclude(id=task_user.team_id).first()
+        self.client.force_authenticate(user=task_user)
+
+        resp = self.client.post(
+            reverse("task-list"),
+            HTTP_ACCEPT="application/json",
+            data={"title": "제목", "content": "내용", "team_ids": [task_user.team_id]},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        task = Task.objects.get(id=resp.json()["id"])
+        self.assertEqual(
+            list(task.team_inbox.values_list("team_id", flat=True)),
+            [task_user.team_id],
+        )
+
+        resp = self.client.post(
+            reverse("sub-task-list", kwargs={"task_id": task.id}),
+            HTTP_ACCEPT="application/json",
+            format="json",
+            data={"task": task.id, "team": add_team.id},
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(task.team_inbox.filter(team=add_team).exists())
+
+        for sub_task in task.sub_tasks.all():
+            self._test_delete_sub_task(
+                expect_status_code=status.HTTP_204_NO_CONTENT,
+                task_id=task.id,
+                delete_sub_task_id=sub_task.id,
+                user=task_user,
+            )
+        self.assertEqual(
+            list(task.team_inbox.values_list("team_id", flat=True)),
+            [task_user.team_id],
+        )
+
+    def test_migration_fills_team_task_inbox(self):
+        migration = import_module("app.migrations.0003_team_task_inbox")
+        task_user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=task_user)
+        sub_task_teams = [
+            task_user.team,
+            *Team.objects.exclude(id=task_user.team_id)[:2],
+        ]
+        create_fake_sub_tasks(teams=sub_task_teams, task=task)
+        TeamTaskInbox.objects.all().delete()
+
+        migration.fill_team_task_inbox(apps, SimpleNamespace(connection=connection))
+
+        self.assertEqual(
+            sorted(task.team_inbox.values_list("team_id", flat=True)),
+            sorted(team.id for team in sub_task_teams),
+        )
+        self.assertEqual(task.team_inbox.first().task_created_at, task.created_at)
+
+    def _create_task_statements(self, user, team_ids):
+        """
+        업무 생성 요청의 (문장 종류, 테이블) 목록. DB 의 파라미터 수 제한으로 한 INSERT 가
+        여러 문장으로 나뉜 경우(SQLite 999 개)는 한 문장으로 셉니다.
+        """
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            resp = self.client.post(
+                reverse("task-list"),
+                HTTP_ACCEPT="application/json",
+                data={"title": "제목", "content": "내용", "team_ids": team_ids},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(resp.json()["sub_tasks"]), len(team_ids))
+
+        statements = []
+        for query in context.captured_queries:
+            sql = query["sql"]
+            table = re.search(r'(?:INTO|FROM|UPDATE)\s+[`"]?(\w+)', sql, re.I)
+            statement = (sql.split()[0].upper(), table and table.group(1))
+            if statement[0] == "INSERT" and statements and statements[-1] == statement:
+                continue
+            statements.append(statement)
+
+        return statements
+
+    def test_create_task_query_count_is_constant(self):
+        user = random.choice(User.objects.all())
+        Team.objects.bulk_create(
+            Team(team_name=f"인증 팀 {index}", is_verified=True) for index in range(200)
+        )
+        team_ids = list(Team.objects.values_list("id", flat=True))
+        # 팀 조회 캐시를 채워 두 요청이 같은 조건에서 실행되도록 합니다.
+        self._create_task_statements(user, team_ids[:200])
+
+        self.assertEqual(
+            self._create_task_statements(user, team_ids[:3]),
+            self._create_task_statements(user, team_ids[:200]),
+        )
+
+    def test_fail_create_task_to_not_verified_team(self):
+        user = random.choice(User.objects.all())
+        not_verified_team = create_fake_team(is_verified=False)
+        task_count = Task.objects.count()
+
+        self.client.force_authenticate(user=user)
+        for team_ids in [
+            [user.team_id, not_verified_team.id],
+            [user.team_id, not_verified_team.id + 1],
+        ]:
+            resp = self.client.post(
+                reverse("task-list"),
+                HTTP_ACCEPT="application/json",
+                data={"title": "제목", "content": "내용", "team_ids": team_ids},
+                format="json",
+            )
+            self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(Task.objects.count(), task_count)
+
+    def _bulk_create_tasks(self, user, mode, tasks):
+        self.client.force_authenticate(user=user)
+        return self.client.post(
+            reverse("task-bulk"),
+            HTTP_ACCEPT="application/json",
+            data={"mode": mode, "tasks": tasks},
+            format="json",
+        )
+
+    def test_success_bulk_create_tasks(self):
+        user = random.choice(User.objects.all())
+        team_ids = list(Team.objects.values_list("id", flat=True))
+        tasks = [
+            {"title": f"업무 {index}", "content": "내용", "team_ids": team_ids[:index]}
+            for index in range(1, 4)
+        ]
+
+        # MySQL 처럼 bulk_create 가 pk 를 돌려주지 않는 경우도 업무를 한 문장으로 넣습니다.
+        for can_return_rows in [True, False]:
+            with self.subTest(can_return_rows=can_return_rows), patch.object(
+                type(connection.features),
+                "can_return_rows_from_bulk_insert",
+                can_return_rows,
+            ), CaptureQueriesContext(connection) as context:
+                resp = self._bulk_create_tasks(user, "atomic", tasks)
+
+                self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+                task_inserts = [
+                    query
+                    for query in context.captured_queries
+                    if query["sql"].startswith('INSERT INTO "app_task"')
+                ]
+                self.assertEqual(len(task_inserts), 1)
+                self._assert_bulk_created_tasks(user, team_ids, resp.json()["results"])
+
+    def _assert_bulk_created_tasks(self, user, team_ids, results):
+        self.assertEqual([result["status"] for result in results], ["created"] * 3)
+        for index, result in enumerate(results, start=1):
+            task = Task.objects.get(id=result["id"])
+            self.assertEqual(task.title, f"업무 {index}")
+            self.assertEqual(task.team_id, user.team_id)
+            self.assertEqual(
+                sorted(task.sub_tasks.values_list("team_id", flat=True)),
+                sorted(team_ids[:index]),
+            )
+            self.assertEqual(
+                sorted(task.team_inbox.values_list("team_id", flat=True)),
+                sorted({user.team_id, *team_ids[:index]}),
+            )
+
+    def test_bulk_create_tasks_with_invalid_task(self):
+        user = random.choice(User.objects.all())
+        team_id = Team.objects.first().id
+        not_verified_team = create_fake_team(is_verified=False)
+        tasks = [
+            {"title": "업무", "content": "내용", "team_ids": [team_id]},
+            {"title": "업무", "content": "내용", "team_ids": [not_verified_team.id]},
+            {"title": "업무", "team_ids": [team_id]},
+        ]
+        task_count = Task.objects.count()
+
+        resp = self._bulk_create_tasks(user, "atomic", tasks)
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [result["status"] for result in resp.json()["results"]],
+            ["skipped", "invalid", "invalid"],
+        )
+        self.assertEqual(resp.json()["results"][0]["index"], 0)
+        self.assertEqual(Task.objects.count(), task_count)
+
+        resp = self._bulk_create_tasks(user, "best_effort", tasks)
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        results = resp.json()["results"]
+        self.assertEqual(
+            [result["status"] for result in results], ["created", "invalid", "invalid"]
+        )
+        self.assertIn("content", results[2]["errors"])
+        self.assertEqual(Task.objects.count(), task_count + 1)
+
+    def test_complete_sub_task_updates_open_sub_task_count(self):
+        user = random.choice(User.objects.all())
+        task = create_fake_task(create_user=user)
+        sub_tasks = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=3), task=task
+        )
+        task.refresh_from_db()
+        self.assertEqual(task.open_sub_task_count, 3)
+
+        for index, sub_task in enumerate(sub_tasks, start=1):
+            # 저장점 + 하위 업무 완료 + 미완료 수 차감 + 업무 완료 처리
+            # + 업무 리스트 버전을 갱신할 팀 조회 + 저장점 해제
+            with self.assertNumQueries(6):
+                CompleteSubTaskSerializer().update(sub_task, {})
+
+            # 이미 완료된 하위 업무를 다시 완료해도 두 번 차감되지 않아야 합니다.
+            CompleteSubTaskSerializer().update(SubTask.objects.get(id=sub_task.id), {})
+
+            task.refresh_from_db()
+            self.assertEqual(task.open_sub_task_count, 3 - index)
+            self.assertEqual(task.is_complete, index == 3)
+
+    def test_success_complete_sub_tasks(self):
+        user = random.choice(User.objects.all())
+        sub_task_team, other_team = random.sample(list(Team.objects.all()), k=2)
+        sub_task_user = User.objects.filter(team=sub_task_team).first()
+
+        rolled_up_task = create_fake_task(create_user=user)
+        rolled_up_sub_tasks = create_fake_sub_tasks(
+            teams=[sub_task_team], task=rolled_up_task
+        )
+        open_task = create_fake_task(create_user=user)
+        open_sub_tasks = create_fake_sub_tasks(
+            teams=[sub_task_team, other_team], task=open_task
+        )
+        sub_task_ids = [rolled_up_sub_tasks[0].id, open_sub_tasks[0].id]
+
+        self.client.force_authenticate(user=sub_task_user)
+        resp = self.client.post(
+            reverse("task-sub-tasks-completion"),
+            HTTP_ACCEPT="application/json",
+            data={"sub_task_ids": sub_task_ids},
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.json()["completed_sub_task_ids"], sorted(sub_task_ids))
+        self.assertEqual(
+            SubTask.objects.filter(id__in=sub_task_ids, is_complete=True).count(), 2
+        )
+
+        rolled_up_task.refresh_from_db()
+        open_task.refresh_from_db()
+        self.assertTrue(rolled_up_task.is_complete)
+        self.assertEqual(rolled_up_task.open_sub_task_count, 0)
+        self.assertFalse(open_task.is_complete)
+        self.assertEqual(open_task.open_sub_task_count, 1)
+
+        other_team_sub_task_id = open_sub_tasks[1].id
+        resp = self.client.post(
+            reverse("task-sub-tasks-completion"),
+            HTTP_ACCEPT="application/json",
+            data={"sub_task_ids": [other_team_sub_task_id]},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(SubTask.objects.get(id=other_team_sub_task_id).is_complete)
+
+    def test_team_registry_invalidated_by_version(self):
+        team = create_fake_team(is_verified=False)
+        team_ids = list(Team.objects.values_list("id", flat=True))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(set(team_registry.get_many(team_ids)), set(team_ids))
+        with self.assertNumQueries(0):
+            self.assertFalse(team_registry.get(team.id).is_verified)
+
+        team.is_verified = True
+        with self.captureOnCommitCallbacks(execute=True):
+            team.save()
+        # 버전 확인 주기가 지나면 다른 워커에서도 변경이 보여야 합니다.
+        team_registry._checked_at = 0.0
+
+        self.assertTrue(team_registry.get(team.id).is_verified)
+
+    def test_team_registry_invalidated_by_queryset_update(self):
+        team = create_fake_team(is_verified=False)
+        self.assertFalse(team_registry.get(team.id).is_verified)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Team.objects.filter(id=team.id).update(is_verified=True)
+        team_registry._checked_at = 0.0
+
+        self.assertTrue(team_registry.get(team.id).is_verified)
+
+    def test_success_get_teams(self):
+        user = random.choice(User.objects.all())
+        self.client.force_authenticate(user=user)
+
+        resp = self.client.get(reverse("team-list"), HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [team["team_name"] for team in resp.json()],
+            list(Team.objects.order_by("id").values_list("team_name", flat=True)),
+        )
+
+        with self.assertNumQueries(0):
+            resp = self.client.get(reverse("team-list"), HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def _issue_access_token(self, user, password):
+        resp = self.client.post(
+            reverse("token"),
+            HTTP_ACCEPT="application/json",
+            data={"user_name": user.user_name, "password": password},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        return resp.json()["access"]
+
+    def test_success_request_with_token_without_user_query(self):
+        team = random.choice(Team.objects.all())
+        user, password = create_fake_user(team=team)
+        task = create_fake_task(create_user=user)
+        sub_task = create_fake_sub_tasks(teams=[team], task=task)[0]
+
+        access_token = self._issue_access_token(user, password)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        with CaptureQueriesContext(connection) as context:
+            resp = self.client.get(reverse("task-list"), HTTP_ACCEPT="application/json")
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertEqual([task["id"] for task in resp.json()["results"]], [task.id])
+
+            resp = self.client.post(
+                reverse(
+                    "sub-task-completion",
+                    kwargs={"task_id": task.id, "pk": sub_task.id},
+                ),
+                HTTP_ACCEPT="application/json",
+            )
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        queried_tables = " ".join(query["sql"] for query in context.captured_queries)
+        self.assertNotRegex(queried_tables, r"\bapp_user\b")
+        self.assertNotRegex(queried_tables, r"\bapp_team\b")
+
+    def test_fail_request_with_token_without_team_claim(self):
+        user, _ = create_fake_user(team=random.choice(Team.objects.all()))
+        token = AccessToken.for_user(user)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        resp = self.client.get(reverse("task-list"), HTTP_ACCEPT="application/json")
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def _get_tasks_with_etag(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(
+            reverse("task-list"), HTTP_ACCEPT="application/json", **headers
+        )
+
+    def test_get_tasks_not_modified(self):
+        task_user = random.choice(User.objects.all())
+        sub_task_team = Team.objects.exclude(id=task_user.team_id).first()
+        sub_task_user = User.objects.filter(team=sub_task_team).first()
+        task = create_fake_task(create_user=task_user)
+        sub_task = create_fake_sub_tasks(teams=[sub_task_team], task=task)[0]
+
+        self.client.force_authenticate(user=task_user)
+        resp = self._get_tasks_with_etag()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        etag = resp["ETag"]
+
+        with self.assertNumQueries(0):
+            resp = self._get_tasks_with_etag(etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp["ETag"], etag)
+
+        # 하위 업무 팀의 완료 처리도 업무 팀의 리스트 버전을 바꿔야 합니다.
+        self.client.force_authenticate(user=sub_task_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(
+                reverse(
+                    "sub-task-completion",
+                    kwargs={"task_id": task.id, "pk": sub_task.id},
+                ),
+                HTTP_ACCEPT="application/json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=task_user)
+        resp = self._get_tasks_with_etag(etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+        self.assertTrue(resp.json()["results"][0]["is_complete"])
+
+        etag = resp["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.patch(
+                reverse("task-detail", kwargs={"pk": task.id}),
+                HTTP_ACCEPT="application/json",
+                data={"title": "변경된 제목"},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._get_tasks_with_etag(etag).status_code, status.HTTP_200_OK
+        )
+
+    def test_get_tasks_from_fragment_cache(self):
+        user = random.choice(User.objects.all())
+        sub_task_team = Team.objects.exclude(id=user.team_id).first()
+        tasks = bulk_create_fake_tasks(user, 3)
+        sub_task = create_fake_sub_tasks(teams=[sub_task_team], task=tasks[0])[0]
+        self.client.force_authenticate(user=user)
+
+        with self.assertNumQueries(2):
+            first_resp = self._get_tasks_with_etag()
+        self.assertEqual(task_fragment_cache.stats()["misses"], 3)
+
+        # 모든 업무가 캐시되어 있으면 하위 업무를 조회하지 않습니다.
+        with self.assertNumQueries(1):
+            resp = self._get_tasks_with_etag()
+        self.assertEqual(resp.json(), first_resp.json())
+        self.assertEqual(task_fragment_cache.stats()["hits"], 3)
+
+        CompleteSubTaskSerializer().update(sub_task, {})
+        with self.assertNumQueries(2):
+            resp = self._get_tasks_with_etag()
+        self.assertEqual(task_fragment_cache.stats()["misses"], 4)
+
+        changed_task = next(
+            task for task in resp.json()["results"] if task["id"] == tasks[0].id
+        )
+        self.assertTrue(changed_task["is_complete"])
+        self.assertTrue(changed_task["sub_tasks"][0]["is_complete"])
+
+    def test_fast_task_list_is_byte_compatible(self):
+        user = random.choice(User.objects.all())
+        tasks = [
+            create_fake_task(create_user=user, title="한글 제목\u2028줄바꿈") for _ in range(3)
+        ]
+        sub_tasks = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=3), task=tasks[0]
+        )
+        CompleteSubTaskSerializer().update(sub_tasks[0], {})
+
+        self.client.force_authenticate(user=user)
+        resp = self._get_tasks_with_etag()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        expected_tasks = Task.objects.filter(id__in=[task.id for task in tasks])
+        expected_tasks = expected_tasks.order_by("-created_at", "-id").prefetch_related(
+            Prefetch("sub_tasks", queryset=SubTask.objects.order_by("id"))
+        )
+        expected = JSONRenderer().render(
+            {
+                "next": None,
+                "previous": None,
+                "results": TaskSerializer(expected_tasks, many=True).data,
+            }
+        )
+        self.assertEqual(resp.content, expected)
+
+    def test_success_export_tasks(self):
+        user = random.choice(User.objects.all())
+        tasks = bulk_create_fake_tasks(user, 5)
+        create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=2), task=tasks[0]
+        )
+        self.client.force_authenticate(user=user)
+
+        # 청크마다 업무 / 하위 업무 조회 2번씩, 마지막 청크(1개) 까지 3번 조회합니다.
+        with patch.object(TaskViewSet, "export_chunk_size", 2):
+            with self.assertNumQueries(6):
+                resp = self.client.get(reverse("task-export"))
+                content = b"".join(resp.streaming_content)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        expected_tasks = Task.objects.order_by("-created_at", "-id").prefetch_related(
+            Prefetch("sub_tasks", queryset=SubTask.objects.order_by("id"))
+        )
+        self.assertEqual(
+            content,
+            JSONRenderer().render(TaskSerializer(expected_tasks, many=True).data),
+        )
+
+    def test_success_export_tasks_as_ndjson_and_csv(self):
+        user = random.choice(User.objects.all())
+        tasks = bulk_create_fake_tasks(user, 2)
+        sub_task_teams = random.sample(list(Team.objects.all()), k=2)
+        create_fake_sub_tasks(teams=sub_task_teams, task=tasks[0])
+        self.client.force_authenticate(user=user)
+
+        resp = self.client.get(reverse("task-export") + "?format=ndjson")
+        self.assertEqual(resp["Content-Type"], "application/x-ndjson")
+        lines = b"".join(resp.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["id"] for row in rows], [tasks[1].id, tasks[0].id])
+        self.assertEqual(len(rows[1]["sub_tasks"]), len(sub_task_teams))
+
+        # CSV 는 하위 업무 하나당 한 행으로 펼칩니다.
+        resp = self.client.get(reverse("task-export"), HTTP_ACCEPT="text/csv")
+        self.assertEqual(resp["Content-Type"], "text/csv; charset=utf-8")
+        content = b"".join(resp.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(len(rows), 1 + len(sub_task_teams))
+        self.assertEqual(rows[0]["id"], str(tasks[1].id))
+        self.assertEqual(rows[0]["sub_task_id"], "")
+        self.assertEqual(
+            sorted(int(row["sub_task_team"]) for row in rows[1:]),
+            sorted(team.id for team in sub_task_teams),
+        )
+
+    def test_success_export_tasks_under_asgi(self):
+        from app.asgi import application
+
+        user = random.choice(User.objects.all())
+        tasks = bulk_create_fake_tasks(user, 3)
+        token = TeamTokenObtainPairSerializer.get_token(user).access_token
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": reverse("task-export"),
+            "query_string": b"format=ndjson",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        # 테스트 클라이언트처럼 요청 시작 / 종료 시 테스트 트랜잭션의 연결을 닫지 않게 합니다.
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        try:
+            async_to_sync(application)(scope, receive, send)
+        finally:
+            request_started.connect(close_old_connections)
+            request_finished.connect(close_old_connections)
+
+        self.assertEqual(messages[0]["status"], status.HTTP_200_OK)
+        self.assertFalse(messages[-1].get("more_body", False))
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [task.id for task in tasks[::-1]])
+
+    def test_export_sub_tasks_only_visible_to_team(self):
+        user = random.choice(User.objects.all())
+        other_user = User.objects.exclude(team_id=user.team_id).first()
+        task = create_fake_task(create_user=user)
+        other_task = create_fake_task(create_user=other_user)
+        sub_tasks = create_fake_sub_tasks(
+            teams=random.sample(list(Team.objects.all()), k=2), task=task
+        )
+        create_fake_sub_tasks(
+            teams=list(Team.objects.exclude(id=user.team_id)[:1]), task=other_task
+        )
+        self.client.force_authenticate(user=user)
+
+        resp = self.client.get(reverse("task-sub-tasks-export") + "?format=csv")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        content = b"".join(resp.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(
+            [int(row["id"]) for row in rows],
+            sorted(sub_task.id for sub_task in sub_tasks),
+        )
+
+    def test_success_async_task_views(self):
+        user = random.choice(User.objects.all())
+        other_team = Team.objects.exclude(id=user.team_id).first()
+        tasks = bulk_create_fake_tasks(user, 3)
+        sub_task, other_sub_task = create_fake_sub_tasks(
+            teams=[user.team, other_team], task=tasks[0]
+        )
+        token = TeamTokenObtainPairSerializer.get_token(user).access_token
+        auth = {"AUTHORIZATION": f"Bearer {token}"}
+
+        resp = async_to_sync(self.async_client.get)(reverse("async-task-list"))
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        resp = async_to_sync(self.async_client.get)(reverse("async-task-list"), **auth)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=user)
+        self.assertEqual(resp.json(), self._get_tasks_with_etag().json())
+
+        resp = async_to_sync(self.async_client.get)(
+            reverse("async-task-list"), IF_NONE_MATCH=resp["ETag"], **auth
+        )
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        for completed_sub_task, expect_status_code in [
+            (other_sub_task, status.HTTP_400_BAD_REQUEST),
+            (sub_task, status.HTTP_200_OK),
+        ]:
+            resp = async_to_sync(self.async_client.post)(
+                reverse(
+                    "async-sub-task-completion",
+                    kwargs={"task_id": tasks[0].id, "pk": completed_sub_task.id},
+                ),
+                **auth,
+            )
+            self.assertEqual(resp.status_code, expect_status_code)
+
+        sub_task.refresh_from_db()
+        other_sub_task.refresh_from_db()
+        self.assertTrue(sub_task.is_complete)
+        self.assertFalse(other_sub_task.is_complete)
+
+
+class TaskSearchTests(APITransactionTestCase):
+    """
+    검색은 커밋된 데이터로 확인합니다.
+
+    InnoDB FULLTEXT 인덱스는 커밋된 행만 검색하므로 트랜잭션 안에서 도는 TaskTests 로는
+    MySQL 검색을 확인할 수 없습니다.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        team_registry.clear()
+        task_fragment_cache.clear()
+        create_team_and_user(TEAM_NAMES[:2])
+
+    def _get_search_task_ids(self, search, page_size):
+        query = urlencode({"search": search, "page_size": page_size})
+        url = f"{reverse('task-list')}?{query}"
+        task_ids = []
+        while url:
+            resp = self.client.get(url, HTTP_ACCEPT="application/json")
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            task_ids += [task["id"] for task in resp.json()["results"]]
+            url = resp.json()["next"]
+        return task_ids
+
+    def test_search_tasks(self):
+        user, other_user = User.objects.order_by("id")[:2]
+        self.client.force_authenticate(user=user)
+
+        best = create_fake_task(
+            create_user=user, title="주간 회의록 정리", content="회의에서 나온 업무를 정리합니다."
+        )
+        assigned = create_fake_task(
+            create_user=other_user, title="배포 준비", content="배포 전 회의 일정을 잡습니다."
+        )
+        create_fake_sub_tasks(teams=[user.team], task=assigned)
+        create_fake_task(create_user=user, title="코드 리뷰", content="리뷰 요청을 처리합니다.")
+        create_fake_task(create_user=other_user, title="회의실 예약", content="다른 팀 업무")
+
+        self.assertEqual(
+            self._get_search_task_ids("회의", page_size=1), [best.id, assigned.id]
+        )
+
+        # 검색하지 않은 리스트의 커서를 검색에 쓰면 정렬 필드 타입이 달라 404 입니다.
+        resp = self.client.get(reverse("task-list"), {"page_size": 1})
+        cursor = parse_qs(urlparse(resp.json()["next"]).query)["cursor"][0]
+        resp = self.client.get(reverse("task-list"), {"cursor": cursor, "search": "회의"})
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+        best.title = "주간 보고"
+        best.content = "보고서를 작성합니다."
+        best.save()
+        resp = self.client.get(
+            reverse("task-list"), {"search": "회의"}, HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual([task["id"] for task in resp.json()["results"]], [assigned.id])
+
+    def test_search_tasks_with_equal_ranks(self):
+        user = User.objects.order_by("id").first()
+        self.client.force_authenticate(user=user)
+        # 제목 / 내용이 같아 관련도가 같은 업무는 id 역순으로 나뉘어 빠짐없이 조회됩니다.
+        tasks = [
+            create_fake_task(create_user=user, title="회의 준비", content="회의 자료")
+            for _ in range(5)
+        ]
+        create_fake_task(create_user=user, title="코드 리뷰", content="리뷰 요청")
+
+        for page_size in [1, 2, 5]:
+            with self.subTest(page_size=page_size):
+                self.assertEqual(
+                    self._get_search_task_ids("회의", page_size),
+                    [task.id for task in reversed(tasks)],
+                )
+
+    def test_cursor_keeps_decimal_search_rank(self):
+        # MySQL 의 관련도는 DECIMAL 이므로 커서를 거쳐도 같은 값으로 비교되어야 합니다.
+        queryset = Task.objects.annotate(
+            search_rank=Value(
+                Decimal("0.123456"),
+                output_field=DecimalField(max_digits=20, decimal_places=6),
+            )
+        )
+        paginator = KeysetCursorPagination()
+        paginator.fields = ["search_rank", "id"]
+
+        position = get_position(
+            {"search_rank": Decimal("0.123456"), "id": 3}, paginator.fields
+        )
+        position = json.loads(json.dumps(position))
+        self.assertEqual(
+            paginator.clean_position(queryset, position), [Decimal("0.123456"), 3]
+        )
+
+    def test_search_tasks_after_bulk_load(self):
+        def get_indexes():
+            with connection.cursor() as cursor:
+                return {
+                    table: set(connection.introspection.get_constraints(cursor, table))
+                    for table in ["app_task", "app_subtask", "app_teamtaskinbox"]
+                }
+
+        indexes = get_indexes()
+        call_command("seed_data", teams=3, users=6, tasks=50, seed=3, stdout=StringIO())
+        # 적재 동안 지웠던 인덱스 / 전문 검색 색인 트리거를 다시 만들고, 적재한 업무도 색인합니다.
+        self.assertEqual(get_indexes(), indexes)
+
+        task = Task.objects.order_by("-id").first()
+        self.client.force_authenticate(user=task.create_user)
+        self.assertIn(
+            task.id, self._get_search_task_ids(task.title.split()[0], page_size=100)
+        )
+
+        task = create_fake_task(create_user=task.create_user, title="적재 이후 업무")
+        self.assertEqual(self._get_search_task_ids("적재", page_size=100), [task.id])
@@ -15,16 +15,21 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
-)
+from drf_spectacular.views import SpectacularSwaggerView, SpectacularRedocView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from app.views.metrics import MetricsView
+from app.views.schema import OpenAPISchemaView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("app.urls.task")),
-    path("schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("", include("app.urls.team")),
+    path("", include("app.urls.async_task")),
+    path("token/", TokenObtainPairView.as_view(), name="token"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("schema/", OpenAPISchemaView.as_view(), name="schema"),
     path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 ]
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from app.views.async_task import AsyncTaskListView, AsyncSubTaskCompletionView
+
+urlpatterns = [
+    path("async/tasks/", AsyncTaskListView.as_view(), name="async-task-list"),
+    path(
+        "async/tasks/<int:task_id>/sub-tasks/<int:pk>/completion/",
+        AsyncSubTaskCompletionView.as_view(),
+        name="async-sub-task-completion",
+    ),
+]
@@ -0,0 +1,9 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+
+from app.views.team import TeamViewSet
+
+team_router = DefaultRouter()
+team_router.register("teams", TeamViewSet, basename="team")
+
+urlpatterns = [path("", include(team_router.urls))]
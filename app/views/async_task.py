@@ -0,0 +1,135 @@
+"""
+ASGI 에서 요청마다 스레드를 점유하지 않는 비동기 뷰.
+
+DRF 3.14 의 APIView 는 비동기 핸들러를 지원하지 않으므로 Django 의 비동기 View 위에서
+인증과 예외 응답만 DRF 와 같은 방식으로 처리합니다. 트랜잭션이 필요한 완료 처리는
+Django 의 비동기 ORM 이 트랜잭션을 지원하지 않아 sync_to_async 로 실행합니다.
+"""
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views import View
+from django_filters.utils import translate_validation
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from app.filters import TaskFilter
+from app.models import Task, SubTask
+from app.pagination import KeysetCursorPagination
+from app.renderers import ORJSONRenderer
+from app.serializers.task import CompleteSubTaskSerializer
+from app.serializers.task_rows import aget_sub_task_rows_by_task
+from app.views.task import TaskListMixin
+
+
+class AsyncAPIView(View):
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    renderer_class = ORJSONRenderer
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # APIView 와 같이 토큰 인증만 사용하므로 CSRF 검사를 하지 않습니다.
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(
+            request,
+            authenticators=[auth() for auth in self.authentication_classes],
+        )
+        self.request = request
+        try:
+            # 토큰 클레임만으로 인증하므로 DB 를 조회하지 않습니다.
+            if not request.user.is_authenticated:
+                raise NotAuthenticated()
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            return self.handle_exception(exc)
+
+    def handle_exception(self, exc):
+        data = exc.detail
+        if not isinstance(data, (list, dict)):
+            data = {"detail": data}
+
+        response = self.render_response(data, exc.status_code)
+        if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            authenticators = self.request.authenticators
+            if authenticators:
+                response["WWW-Authenticate"] = authenticators[0].authenticate_header(
+                    self.request
+                )
+        return response
+
+    def render_response(self, data, status_code=status.HTTP_200_OK):
+        return HttpResponse(
+            self.renderer_class().render(data),
+            status=status_code,
+            content_type=self.renderer_class.media_type,
+        )
+
+
+class AsyncTaskListView(TaskListMixin, AsyncAPIView):
+    """
+    TaskViewSet.list 의 비동기 버전.
+    """
+
+    pagination_class = KeysetCursorPagination
+
+    async def get(self, request, *args, **kwargs):
+        version = await sync_to_async(self.get_list_version)(request)
+        etag = self.get_list_etag(request, version)
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            with self.read_list_from(version):
+                response = self.render_response(await self.get_page_data(request))
+
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept", "Authorization"])
+        return response
+
+    async def get_page_data(self, request):
+        # 조회 없이 쿼리셋만 만들므로 DjangoFilterBackend 와 같이 바로 거릅니다.
+        filterset = TaskFilter(
+            request.query_params,
+            Task.objects.visible_to(request.user.team_id),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+        queryset = filterset.qs.values(*self.get_list_value_fields())
+        paginator = self.pagination_class()
+        page_queryset = paginator.get_page_queryset(queryset, request, self)
+        tasks = paginator.set_page([task async for task in page_queryset])
+
+        fragments, misses = self.get_cached_fragments(tasks)
+        if misses:
+            sub_task_rows = await aget_sub_task_rows_by_task(
+                [task["id"] for task in misses]
+            )
+            self.build_fragments(fragments, misses, sub_task_rows)
+
+        return paginator.get_paginated_data([fragments[task["id"]] for task in tasks])
+
+
+class AsyncSubTaskCompletionView(AsyncAPIView):
+    """
+    SubTaskViewSet.complete_task 의 비동기 버전.
+    """
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            sub_task = await SubTask.objects.aget(id=kwargs["pk"])
+        except SubTask.DoesNotExist:
+            raise ValidationError("존재하지 않는 하위업무 입니다.")
+
+        if request.user.team_id != sub_task.team_id:
+            raise ValidationError("업무팀에 소속되지 않은 팀은 완료 처리를 할 수 없습니다.")
+
+        await sync_to_async(CompleteSubTaskSerializer().update)(sub_task, {})
+
+        return self.render_response({"message": "업무가 정상적으로 완료처리 되었습니다."})
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from app.metrics import registry
+
+
+class MetricsView(View):
+    """
+    이 프로세스의 메트릭을 Prometheus 텍스트 형식으로 응답합니다.
+
+    METRICS_ALLOWED_IPS 에서 온 요청이나 METRICS_TOKEN 을 가진 요청이 아니면 404 로 응답합니다.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            raise Http404
+        return HttpResponse(registry.render(), content_type=self.content_type)
+
+    @staticmethod
+    def has_access(request):
+        if request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS:
+            return True
+
+        token = settings.METRICS_TOKEN
+        return bool(token) and constant_time_compare(
+            request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {token}"
+        )
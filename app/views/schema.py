@@ -0,0 +1,63 @@
+import hashlib
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+from django.views import View
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.views import SpectacularAPIView
+
+
+def generate_schema():
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    return OpenApiYamlRenderer().render(schema, renderer_context={})
+
+
+# 읽은 스키마 파일 (경로 -> (내용, ETag))
+_schemas = {}
+
+
+def load_schema(path):
+    """
+    빌드 시 만든 스키마 파일과 ETag 를 읽습니다. 파일이 없으면 None 을 돌려줍니다.
+
+    읽은 파일만 저장하므로, 파일이 없던 동안에는 요청마다 다시 확인합니다.
+    """
+    if path not in _schemas:
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        _schemas[path] = content, quote_etag(hashlib.md5(content).hexdigest())
+
+    return _schemas[path]
+
+
+class OpenAPISchemaView(View):
+    """
+    build_openapi_schema 로 만든 스키마 파일을 응답합니다.
+
+    스키마는 배포 사이에 바뀌지 않으므로 요청마다 뷰/시리얼라이저를 분석하지 않고,
+    ETag 와 Cache-Control 로 클라이언트 캐시를 사용하게 합니다.
+    파일이 없으면 SpectacularAPIView 로 그때그때 만듭니다.
+    """
+
+    content_type = OpenApiYamlRenderer.media_type
+    cache_control = "public, max-age=3600"
+
+    def get(self, request, *args, **kwargs):
+        schema = load_schema(settings.OPENAPI_SCHEMA_FILE)
+        if schema is None:
+            return SpectacularAPIView.as_view()(request, *args, **kwargs)
+
+        content, etag = schema
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=self.content_type)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = self.cache_control
+        return response
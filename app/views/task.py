@@ -1,4 +1,14 @@
-from django.db.models import Q
+import hashlib
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from rest_framework import status
@@ -8,19 +18,140 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from app.models import Task, SubTask
+from app.cache import (
+    bump_team_task_versions,
+    get_team_task_version,
+    is_recent_version,
+    task_fragment_cache,
+)
+from app.db.routers import read_from_replica
+from app.filters import TaskFilter
+from app.models import Task, SubTask, TeamTaskInbox
+from app.pagination import KeysetCursorPagination
+from app.renderers import ORJSONRenderer, NDJSONRenderer, CSVRenderer
 from app.permissions import IsCreator
 from app.serializers.task import (
+    BulkCreateTaskSerializer,
     TaskSerializer,
     CreateTaskSerializer,
     CompleteSubTaskSerializer,
+    CompleteSubTasksSerializer,
     SubTaskSerializer,
     UpdateTaskSerializer,
     CreateSubTaskSerializer,
 )
-
+from app.serializers.task_rows import (
+    FLAT_TASK_HEADER,
+    SUB_TASK_FIELDS,
+    TASK_FIELDS,
+    build_task_row,
+    flatten_task_rows,
+    get_sub_task_rows_by_task,
+    iter_sub_task_rows,
+    iter_task_rows,
+)
 from app.view import CreateModelMixin, UpdateModelMixin
 
+EXPORT_RENDERER_CLASSES = [ORJSONRenderer, NDJSONRenderer, CSVRenderer]
+
+
+class TaskListMixin:
+    """
+    업무 리스트 응답의 ETag / 직렬화. 동기 / 비동기 리스트 뷰가 함께 사용합니다.
+    """
+
+    default_cursor_ordering = ("-inbox_created_at", "-inbox_task_id")
+    # 검색 결과는 관련도 순으로 정렬합니다.
+    search_cursor_ordering = ("-search_rank", "-inbox_task_id")
+
+    @property
+    def cursor_ordering(self):
+        request = getattr(self, "request", None)
+        if request is not None and request.query_params.get("search", "").strip():
+            return self.search_cursor_ordering
+        return self.default_cursor_ordering
+
+    def get_list_value_fields(self):
+        cursor_fields = [field.lstrip("-") for field in self.cursor_ordering]
+        return [*TASK_FIELDS, "modified_at", "sub_task_version", *cursor_fields]
+
+    def serialize_tasks(self, tasks):
+        """
+        `.values()` 로 조회한 업무 중 (업무 id, 수정시간, 하위 업무 버전) 이 같은 업무는
+        캐시된 직렬화 결과를 쓰고, 나머지만 하위 업무를 한 번에 가져와 응답 행을 만듭니다.
+        """
+        fragments, misses = self.get_cached_fragments(tasks)
+        if misses:
+            sub_task_rows = get_sub_task_rows_by_task([task["id"] for task in misses])
+            self.build_fragments(fragments, misses, sub_task_rows)
+
+        return [fragments[task["id"]] for task in tasks]
+
+    def get_cached_fragments(self, tasks):
+        fragments, misses = {}, []
+        with self.time_serialize():
+            for task in tasks:
+                stamp = self._fragment_stamp(task)
+                fragment = task_fragment_cache.get(task["id"], stamp)
+                if fragment is None:
+                    misses.append(task)
+                else:
+                    fragments[task["id"]] = fragment
+
+        return fragments, misses
+
+    def build_fragments(self, fragments, misses, sub_task_rows):
+        with self.time_serialize():
+            for task in misses:
+                fragment = build_task_row(task, sub_task_rows.get(task["id"], []))
+                task_fragment_cache.set(
+                    task["id"], self._fragment_stamp(task), fragment
+                )
+                fragments[task["id"]] = fragment
+
+    @contextmanager
+    def time_serialize(self):
+        """
+        응답 행을 만드는(캐시 조회 포함) 시간을 요청 타이머에 더합니다.
+        하위 업무 조회는 DB 시간으로 따로 재므로 포함하지 않습니다.
+        """
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            timer = getattr(self.request, "timer", None)
+            if timer is not None:
+                timer.record_serialize(started)
+
+    @staticmethod
+    def _fragment_stamp(task):
+        return task["modified_at"], task["sub_task_version"]
+
+    def get_list_version(self, request):
+        return get_team_task_version(request.user.team_id)
+
+    def get_list_etag(self, request, version):
+        key = "|".join(
+            [
+                str(request.user.team_id),
+                version,
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+            ]
+        )
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def read_list_from(self, version):
+        """
+        버전이 갱신된 직후에는 리스트를 primary 에서 읽습니다.
+
+        복제 DB 가 갱신 전 데이터를 새 ETag 로 내려주면 클라이언트는 이후 304 만 받아
+        변경을 보지 못하므로, 복제 지연을 덮는 REPLICA_PIN_SECONDS 동안은 primary 에서 읽습니다.
+        """
+        if is_recent_version(version, settings.REPLICA_PIN_SECONDS):
+            return read_from_replica(False)
+        return nullcontext()
+
 
 @extend_schema_view(
     create=extend_schema(summary="업무 생성", request=CreateTaskSerializer),
@@ -32,21 +163,154 @@ from app.view import CreateModelMixin, UpdateModelMixin
     update=extend_schema(exclude=True),
     destroy=extend_schema(exclude=True),
 )
-class TaskViewSet(ModelViewSet, CreateModelMixin, UpdateModelMixin):
+class TaskViewSet(ModelViewSet, CreateModelMixin, UpdateModelMixin, TaskListMixin):
     permission_classes = [IsAuthenticated]
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     create_serializer_class = CreateTaskSerializer
     update_serializer_class = UpdateTaskSerializer
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = TaskFilter
+    export_chunk_size = 1000
 
     def get_queryset(self):
         user = self.request.user
-        queryset = self.queryset.filter(
-            Q(team_id=user.team_id) | Q(sub_tasks__team_id=user.team_id)
-        ).distinct()
+        queryset = self.queryset.visible_to(user.team_id)
+        # 리스트는 캐시되지 않은 업무의 하위 업무만 따로 가져옵니다.
+        if self.action != "list":
+            queryset = queryset.prefetch_related("sub_tasks")
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        # 팀 업무 버전으로 만든 ETag 가 같으면 조회/직렬화 없이 304 로 응답합니다.
+        version = self.get_list_version(request)
+        etag = self.get_list_etag(request, version)
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            with self.read_list_from(version):
+                queryset = self.filter_queryset(self.get_queryset()).values(
+                    *self.get_list_value_fields()
+                )
+                tasks = self.paginate_queryset(queryset)
+                response = self.get_paginated_response(self.serialize_tasks(tasks))
+
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept", "Authorization"])
+        return response
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            bump_team_task_versions(TeamTaskInbox.objects.team_ids_for([instance.id]))
+            instance.delete()
+
+    @extend_schema(
+        summary="업무 전체 내보내기",
+        description="팀이 볼 수 있는 업무 전체를 하위 업무와 함께 JSON 배열로 스트리밍합니다.",
+        responses=TaskSerializer(many=True),
+    )
+    @action(
+        methods=["get"],
+        detail=False,
+        url_path="export",
+        url_name="export",
+        renderer_classes=EXPORT_RENDERER_CLASSES,
+    )
+    def export(self, request, *args, **kwargs):
+        rows = iter_task_rows(
+            self.filter_queryset(self.get_queryset()),
+            self.cursor_ordering,
+            self.export_chunk_size,
+        )
+        header = None
+        if getattr(request.accepted_renderer, "flat", False):
+            rows, header = flatten_task_rows(rows), FLAT_TASK_HEADER
+
+        return self.get_export_response(rows, "tasks", header)
+
+    @extend_schema(
+        summary="하위 업무 전체 내보내기",
+        description="팀이 볼 수 있는 업무의 하위 업무 전체를 스트리밍합니다.",
+        responses=SubTaskSerializer(many=True),
+    )
+    @action(
+        methods=["get"],
+        detail=False,
+        url_path="sub-tasks/export",
+        url_name="sub-tasks-export",
+        renderer_classes=EXPORT_RENDERER_CLASSES,
+        filter_backends=[],
+    )
+    def export_sub_tasks(self, request, *args, **kwargs):
+        # 업무 리스트와 같이 팀 인박스에 있는 업무의 하위 업무만 내보냅니다.
+        queryset = SubTask.objects.filter(
+            task__team_inbox__team_id=request.user.team_id
+        )
+        rows = iter_sub_task_rows(queryset, self.export_chunk_size)
+
+        return self.get_export_response(rows, "sub_tasks", SUB_TASK_FIELDS)
+
+    def get_export_response(self, rows, name, header=None):
+        """
+        협상된 렌더러로 행들을 조금씩 렌더링하는 스트리밍 응답을 만듭니다.
+        """
+        renderer = self.request.accepted_renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        response = StreamingHttpResponse(
+            renderer.iter_render(rows, {"header": header}), content_type=content_type
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{name}.{renderer.format}"'
+        return response
+
+    @extend_schema(
+        summary="업무 일괄 생성",
+        description="mode=atomic 이면 하나라도 실패할 때 전체를 생성하지 않고, "
+        "mode=best_effort 이면 유효한 업무만 생성합니다.",
+        request=BulkCreateTaskSerializer,
+    )
+    @action(methods=["post"], detail=False, url_path="bulk", url_name="bulk")
+    def bulk_create(self, request, *args, **kwargs):
+        serializer = BulkCreateTaskSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save()
+
+        if not any(result["status"] == "created" for result in results):
+            return Response({"results": results}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"results": results}, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        summary="하위 업무 일괄 완료 처리.",
+        request=CompleteSubTasksSerializer,
+        # 하위 업무 완료 처리와 자동 생성 이름이 겹치므로 직접 지정합니다.
+        operation_id="tasks_sub_tasks_completion_bulk_create",
+    )
+    @action(
+        methods=["post"],
+        detail=False,
+        url_path="sub-tasks/completion",
+        url_name="sub-tasks-completion",
+    )
+    def complete_sub_tasks(self, request, *args, **kwargs):
+        serializer = CompleteSubTasksSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save()
+
+        return Response(
+            {"message": "업무가 정상적으로 완료처리 되었습니다.", **result},
+            status=status.HTTP_200_OK,
+        )
+
 
 @extend_schema_view(
     create=extend_schema(summary="하위 업무 부여", request=CreateSubTaskSerializer),
@@ -57,15 +321,39 @@ class TaskViewSet(ModelViewSet, CreateModelMixin, UpdateModelMixin):
     list=extend_schema(exclude=True),
 )
 class SubTaskViewSet(ModelViewSet):
+    # 하위 업무 변경은 업무함 / 미완료 수 / 버전 갱신을 거치는 생성 / 삭제 / 완료 처리로만 합니다.
+    http_method_names = ["get", "post", "delete", "head", "options"]
     permission_classes = [IsCreator]
     queryset = SubTask.objects.all()
     serializer_class = SubTaskSerializer
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            sub_task = serializer.save()
+            TeamTaskInbox.objects.add_entries(sub_task.task, [sub_task.team_id])
+            Task.objects.add_open_sub_task_count(sub_task.task_id, 1)
+            bump_team_task_versions(
+                TeamTaskInbox.objects.team_ids_for([sub_task.task_id])
+            )
+
     def destroy(self, request, *args, **kwargs):
         sub_task = self.get_object()
-        if sub_task.is_complete:
-            raise ValidationError("완료된 하위업무는 삭제할 수 없습니다.")
-        return super().destroy(request, *args, **kwargs)
+
+        with transaction.atomic():
+            team_ids = TeamTaskInbox.objects.team_ids_for([sub_task.task_id])
+            # 확인 후 동시에 완료되었을 수 있으므로 미완료일 때만 지우고 미완료 수를 줄입니다.
+            deleted, _ = SubTask.objects.filter(
+                id=sub_task.id, is_complete=False
+            ).delete()
+            if not deleted:
+                raise ValidationError("완료된 하위업무는 삭제할 수 없습니다.")
+
+            TeamTaskInbox.objects.remove_entry(sub_task.task, sub_task.team_id)
+            Task.objects.add_open_sub_task_count(sub_task.task_id, -1)
+            Task.objects.roll_up_completion([sub_task.task_id], timezone.now())
+            bump_team_task_versions(team_ids)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
     @extend_schema(
         summary="하위 업무 완료 처리.",
@@ -83,7 +371,7 @@ class SubTaskViewSet(ModelViewSet):
         if not sub_task:
             raise ValidationError("존재하지 않는 하위업무 입니다.")
 
-        if request.user.team != sub_task.team:
+        if request.user.team_id != sub_task.team_id:
             raise ValidationError("업무팀에 소속되지 않은 팀은 완료 처리를 할 수 없습니다.")
 
         sub_task_serializer = CompleteSubTaskSerializer()
@@ -0,0 +1,27 @@
+from django.core.cache import cache
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from app.models import Team
+from app.registry import team_registry
+from app.serializers.team import TeamSerializer
+
+
+class TeamViewSet(GenericViewSet):
+    permission_classes = [IsAuthenticated]
+    queryset = Team.objects.order_by("id")
+    serializer_class = TeamSerializer
+    pagination_class = None
+
+    @extend_schema(summary="팀 목록 열람.", responses=TeamSerializer(many=True))
+    def list(self, request, *args, **kwargs):
+        # 팀 레지스트리 버전이 바뀌면 키가 달라지므로 별도 무효화가 필요 없습니다.
+        cache_key = f"team-directory:{team_registry.version}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_queryset(), many=True).data
+            cache.set(cache_key, data)
+
+        return Response(data)
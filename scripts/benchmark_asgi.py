@@ -0,0 +1,63 @@
+"""
+uvicorn 으로 띄운 서버에 동시 요청을 보내 동기 / 비동기 업무 리스트 뷰를 비교합니다.
+
+ASGI 에서 동기 뷰는 sync_to_async 스레드 어댑터로 실행되어 요청마다 스레드를 점유하고,
+비동기 뷰는 DB 조회를 기다리는 동안 이벤트 루프를 다른 요청에 넘깁니다.
+
+    uvicorn app.asgi:application --port 8000
+    python scripts/benchmark_asgi.py --token <access token> --concurrency 50
+"""
+import argparse
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+PATHS = {"sync": "/tasks/", "async": "/async/tasks/"}
+
+
+def request(url, token):
+    req = urllib.request.Request(
+        url,
+        headers={"Authorization": f"Bearer {token}", "Accept": "application/json"},
+    )
+    started = time.perf_counter()
+    with urllib.request.urlopen(req) as resp:
+        resp.read()
+    return time.perf_counter() - started
+
+
+def run(url, token, concurrency, requests):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        latencies = sorted(executor.map(lambda _: request(url, token), range(requests)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", required=True, help="업무 리스트를 조회할 access 토큰")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    for name, path in PATHS.items():
+        url = args.base_url.rstrip("/") + path
+        # 캐시 / 커넥션 준비를 위해 한 번 먼저 요청합니다.
+        request(url, args.token)
+        result = run(url, args.token, args.concurrency, args.requests)
+        print(
+            f"{name:>5}: {result['rps']:.1f} req/s, "
+            f"p50 {result['p50']:.2f} ms, p95 {result['p95']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,12 @@
+# python3 manage.py seed_data --base 로 같은 데이터를 만들 수 있습니다.
 # python3 manage.py shell < ./scripts/create_base_data.py
 
-from django.db import transaction
-
-from app.models import Team, User
 from app.constants.task import TEAM_NAMES
+from app.seed import create_teams_and_users
 
 
 def create_team_and_user(team_names):
-    with transaction.atomic():
-        for team_name in TEAM_NAMES:
-            team = Team.objects.create(team_name=team_name, is_verified=True)
-
-            User.objects.create(
-                team=team, user_name=team.team_name + "-" + "유저", password="1234"
-            )
+    create_teams_and_users(team_names, password="1234")
 
 
 if __name__ == "__main__":